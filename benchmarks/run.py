@@ -0,0 +1,240 @@
+"""
+Benchmark djantic against the order models of the test app.
+
+    python -m benchmarks.run --rows 1000 100000 1000000 --output results.json
+
+Each benchmark reports its wall time, the number of queries it issued and its
+peak Python memory, measured in a second run under `tracemalloc`.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+SAMPLE_SIZE = 1000
+SCHEMA_CLASSES = 100
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def rollback() -> Iterator[None]:
+    from django.db import transaction
+
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def measure(name: str, rows: int, func: Callable[[], object], memory: bool) -> Dict:
+    from django.db import connections
+
+    counter = QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+
+    peak_memory: Optional[int] = None
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "name": name,
+        "rows": rows,
+        "seconds": round(seconds, 6),
+        "queries": counter.count,
+        "peak_memory": peak_memory,
+    }
+
+
+def get_benchmarks(rows: int) -> List[Tuple[str, int, Callable[[], object]]]:
+    from pydantic import ConfigDict
+    from testapp.order import Order, OrderUser
+
+    from djantic import ModelSchema
+
+    from .schemas import (
+        OrderFlatSchema,
+        OrderSchema,
+        OrderUserInputSchema,
+        OrderUserSchema,
+    )
+
+    sample = min(rows, SAMPLE_SIZE)
+    orders = list(Order.objects.order_by("id")[:sample])
+    users = list(OrderUser.objects.order_by("id")[:sample])
+    dumped = OrderSchema.from_django(
+        Order.objects.order_by("id")[:sample], many=True, optimize=True
+    )
+    inputs = [
+        OrderUserInputSchema(
+            first_name=f"New {i}", last_name="User", email=f"new{i}@example.com"
+        )
+        for i in range(sample)
+    ]
+    changes = [
+        OrderUserInputSchema.model_construct(
+            first_name=f"Changed {user.id}", _fields_set={"first_name"}
+        )
+        for user in users
+    ]
+    replacements = [
+        OrderUserInputSchema(
+            first_name=f"Saved {user.id}", last_name="User", email=user.email
+        )
+        for user in users
+    ]
+
+    def from_django_single():
+        for order in orders:
+            OrderFlatSchema.from_django(order)
+
+    def from_django_many():
+        OrderFlatSchema.from_django(Order.objects.all(), many=True)
+
+    def from_django_nested():
+        OrderUserSchema.from_django(OrderUser.objects.all(), many=True, optimize=True)
+
+    def model_dump_json():
+        for schema in dumped:
+            schema.model_dump_json()
+
+    def create():
+        with rollback():
+            for schema in inputs:
+                schema.create()
+
+    def update():
+        with rollback():
+            for user, schema in zip(users, changes):
+                schema.update(user, partial=True)
+
+    def save():
+        with rollback():
+            for user, schema in zip(users, replacements):
+                schema.save(user)
+
+    def define_schemas(defer_build: bool) -> None:
+        for i in range(SCHEMA_CLASSES):
+            config = ConfigDict(model=Order, defer_build=defer_build)
+            type(
+                f"OrderSchema{i}",
+                (ModelSchema,),
+                {"__module__": __name__, "model_config": config},
+            )
+
+    def schema_construction():
+        define_schemas(defer_build=False)
+
+    def schema_construction_deferred():
+        define_schemas(defer_build=True)
+
+    return [
+        ("from_django_single", sample, from_django_single),
+        ("from_django_many", rows, from_django_many),
+        ("from_django_nested", OrderUser.objects.count(), from_django_nested),
+        ("model_dump_json", sample, model_dump_json),
+        ("create", sample, create),
+        ("update", sample, update),
+        ("save", sample, save),
+        ("schema_construction", SCHEMA_CLASSES, schema_construction),
+        (
+            "schema_construction_deferred",
+            SCHEMA_CLASSES,
+            schema_construction_deferred,
+        ),
+    ]
+
+
+def get_environment() -> Dict[str, Optional[str]]:
+    import django
+    import pydantic
+
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "pydantic": pydantic.VERSION,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[1000], help="Number of orders to seed"
+    )
+    parser.add_argument(
+        "-k", dest="names", nargs="+", help="Only run the benchmarks with these names"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument(
+        "--no-memory", dest="memory", action="store_false", help="Skip tracemalloc"
+    )
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    import django
+
+    django.setup()
+    from .seed import seed
+
+    results = []
+    for rows in args.rows:
+        seed(rows)
+        for name, count, func in get_benchmarks(rows):
+            if args.names and name not in args.names:
+                continue
+            result = measure(name, count, func, args.memory)
+            result["seeded_rows"] = rows
+            results.append(result)
+            print(
+                f"{rows:>9} {name:<22} {result['seconds']:>10.4f}s "
+                f"{result['queries']:>7} queries "
+                f"{(result['peak_memory'] or 0) / 1024 / 1024:>9.2f} MiB",
+                file=sys.stderr,
+            )
+
+    output = json.dumps({**get_environment(), "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
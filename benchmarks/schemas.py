@@ -0,0 +1,51 @@
+from typing import List
+
+from pydantic import ConfigDict
+from testapp.order import (
+    Order,
+    OrderItem,
+    OrderItemDetail,
+    OrderUser,
+    OrderUserProfile,
+)
+
+from djantic import ModelSchema
+
+
+class OrderItemDetailSchema(ModelSchema):
+    model_config = ConfigDict(model=OrderItemDetail)
+
+
+class OrderItemSchema(ModelSchema):
+    details: List[OrderItemDetailSchema]
+    model_config = ConfigDict(model=OrderItem)
+
+
+class OrderSchema(ModelSchema):
+    items: List[OrderItemSchema]
+    model_config = ConfigDict(model=Order)
+
+
+class OrderFlatSchema(ModelSchema):
+    model_config = ConfigDict(
+        model=Order, include=["id", "total_price", "shipping_address", "user"]
+    )
+
+
+class OrderUserProfileSchema(ModelSchema):
+    model_config = ConfigDict(model=OrderUserProfile)
+
+
+class OrderUserSchema(ModelSchema):
+    orders: List[OrderSchema]
+    profile: OrderUserProfileSchema
+    model_config = ConfigDict(
+        model=OrderUser,
+        include=["id", "first_name", "last_name", "email", "profile", "orders"],
+    )
+
+
+class OrderUserInputSchema(ModelSchema):
+    model_config = ConfigDict(
+        model=OrderUser, include=["first_name", "last_name", "email"]
+    )
@@ -0,0 +1,102 @@
+from decimal import Decimal
+
+from django.core.management import call_command
+from testapp.order import (
+    Order,
+    OrderFactory,
+    OrderItem,
+    OrderItemDetail,
+    OrderItemDetailFactory,
+    OrderItemFactory,
+    OrderUser,
+    OrderUserFactory,
+    OrderUserProfile,
+    OrderUserProfileFactory,
+)
+
+BATCH_SIZE = 10000
+
+ORDERS_PER_USER = 2
+ITEMS_PER_ORDER = 2
+DETAILS_PER_ITEM = 2
+
+
+def _flush(tables) -> None:
+    for model, objs in tables:
+        model._default_manager.bulk_create(objs, batch_size=BATCH_SIZE)
+        objs.clear()
+
+
+def seed(rows: int) -> None:
+    """
+    Create the tables and `rows` orders, with their users, profiles, items and
+    item details. The objects are built with the factories and inserted with
+    `bulk_create`, in batches so memory use stays flat.
+    """
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    call_command("flush", interactive=False, verbosity=0)
+
+    users, profiles, orders, items, details = [], [], [], [], []
+    tables = (
+        (OrderUser, users),
+        (OrderUserProfile, profiles),
+        (Order, orders),
+        (OrderItem, items),
+        (OrderItemDetail, details),
+    )
+    item_id = detail_id = 0
+    for order_id in range(1, rows + 1):
+        user_id = (order_id - 1) // ORDERS_PER_USER + 1
+        if (order_id - 1) % ORDERS_PER_USER == 0:
+            users.append(
+                OrderUserFactory.build(
+                    id=user_id,
+                    first_name=f"First {user_id}",
+                    last_name=f"Last {user_id}",
+                    email=f"user{user_id}@example.com",
+                    orders=[],
+                    profile=False,
+                )
+            )
+            profiles.append(
+                OrderUserProfileFactory.build(
+                    id=user_id, user_id=user_id, address=f"{user_id} Main Street"
+                )
+            )
+
+        orders.append(
+            OrderFactory.build(
+                id=order_id,
+                user_id=user_id,
+                total_price=Decimal(order_id % 1000),
+                shipping_address=f"{user_id} Main Street",
+                items=[],
+            )
+        )
+        for _ in range(ITEMS_PER_ORDER):
+            item_id += 1
+            items.append(
+                OrderItemFactory.build(
+                    id=item_id,
+                    order_id=order_id,
+                    name=f"Item {item_id}",
+                    price=Decimal("9.99"),
+                    quantity=1,
+                    details=[],
+                )
+            )
+            for _ in range(DETAILS_PER_ITEM):
+                detail_id += 1
+                details.append(
+                    OrderItemDetailFactory.build(
+                        id=detail_id,
+                        order_item_id=item_id,
+                        name=f"Detail {detail_id}",
+                        value=detail_id,
+                        quantity=1,
+                    )
+                )
+
+        if len(details) >= BATCH_SIZE:
+            _flush(tables)
+    _flush(tables)
@@ -0,0 +1,10 @@
+import os
+
+from tests.testapp.settings import *  # noqa: F401,F403
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ.get("DJANTIC_BENCHMARK_DB", ":memory:"),
+    }
+}
@@ -1,3 +1,20 @@
-from .main import ModelSchema
+from .fields import register_field_type
+from .instrumentation import (
+    HistogramObserver,
+    Observer,
+    add_observer,
+    remove_observer,
+    track_queries,
+)
+from .main import ModelSchema, generate_json_schemas
 
-__all__ = ["ModelSchema"]
+__all__ = [
+    "HistogramObserver",
+    "ModelSchema",
+    "Observer",
+    "add_observer",
+    "generate_json_schemas",
+    "register_field_type",
+    "remove_observer",
+    "track_queries",
+]
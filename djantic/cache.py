@@ -0,0 +1,436 @@
+import inspect
+import threading
+import weakref
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from itertools import islice
+from types import CodeType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
+from pydantic.errors import PydanticUserError
+
+DEFAULT_VERSION_FIELD = "updated_at"
+
+# How many dependent primary keys are read and deleted at once
+INVALIDATE_BATCH_SIZE = 2000
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """
+    Where and how the fragments of a schema are cached, built from its
+    `model_config["cache"]`.
+    """
+
+    prefix: str
+    alias: str = "default"
+    timeout: Any = DEFAULT_TIMEOUT
+    version_field: Optional[str] = None
+
+
+def get_cache_config(schema_class) -> Optional[CacheConfig]:
+    options = schema_class.model_config.get("cache")
+    if not options:
+        return None
+    if options is True:
+        options = {}
+
+    model = schema_class.model_config["model"]
+    field_names = {field.name for field in model._meta.get_fields()}
+    version_field = options.get("version_field", DEFAULT_VERSION_FIELD)
+    if version_field not in field_names:
+        if "version_field" in options and version_field is not None:
+            raise PydanticUserError(
+                f'model_config["cache"]["version_field"] is {version_field!r}, '
+                f"which is not a field of {model.__name__}.",
+                code="cache-version-field-invalid",
+            )
+        version_field = None
+
+    # Fragments cached for an older definition of the schema are not reused
+    fingerprint = zlib.crc32(",".join(_get_definition(schema_class)).encode())
+    return CacheConfig(
+        prefix=(
+            f"djantic:{schema_class.__module__}.{schema_class.__qualname__}"
+            f":{fingerprint:08x}"
+        ),
+        alias=options.get("alias", "default"),
+        timeout=options.get("timeout", DEFAULT_TIMEOUT),
+        version_field=version_field,
+    )
+
+
+def _get_code(func: Any) -> str:
+    func = getattr(func, "__func__", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return getattr(func, "__qualname__", type(func).__qualname__)
+    consts = tuple(c for c in code.co_consts if not isinstance(c, CodeType))
+    return f"{zlib.crc32(code.co_code + repr(consts).encode()):08x}"
+
+
+def _get_definition(schema_class, seen: tuple = ()) -> List[str]:
+    """
+    The parts of the schema definition its fragments depend on: the fields with
+    their alias, annotation and constraints, the validators, and the definition
+    of nested schemas.
+    """
+    from .main import _get_nested_schema
+
+    seen = seen + (schema_class,)
+    definition = []
+    for key, fieldinfo in schema_class.model_fields.items():
+        definition.append(
+            f"{key}={fieldinfo.alias}:{fieldinfo.annotation!r}:{fieldinfo.metadata!r}"
+        )
+        nested_schema, _ = _get_nested_schema(fieldinfo.annotation)
+        if nested_schema is not None and nested_schema not in seen:
+            definition.extend(_get_definition(nested_schema, seen))
+
+    decorators = schema_class.__pydantic_decorators__
+    kinds = ("validators", "field_validators", "root_validators", "model_validators")
+    for kind in kinds:
+        for name, decorator in getattr(decorators, kind).items():
+            definition.append(f"{kind}.{name}:{_get_code(decorator.func)}")
+    return definition
+
+
+def dump_fragment(instance: Any) -> dict:
+    """
+    The fragment of a validated schema instance: its field values, with nested
+    schemas and enums turned into plain data so any cache backend can store it.
+    """
+    from .main import ModelSchema
+
+    def dump(value: Any) -> Any:
+        if isinstance(value, ModelSchema):
+            return dump_fragment(value)
+        if isinstance(value, list):
+            return [dump(item) for item in value]
+        if isinstance(value, Enum):
+            return value.value
+        return value
+
+    return {
+        key: dump(value)
+        for key, value in instance.__dict__.items()
+        if key in type(instance).model_fields
+    }
+
+
+def load_fragment(schema_class, fragment: dict) -> Any:
+    """
+    Rebuild the schema instance of a fragment without validating it again.
+    """
+    from .main import _get_nested_schema, _get_outer_type
+
+    values = {}
+    for key, fieldinfo in schema_class.model_fields.items():
+        if key not in fragment:
+            continue
+        value = fragment[key]
+        nested_schema, _ = _get_nested_schema(fieldinfo.annotation)
+        if value is None:
+            pass
+        elif nested_schema is not None:
+            if isinstance(value, list):
+                value = [load_fragment(nested_schema, item) for item in value]
+            else:
+                value = load_fragment(nested_schema, value)
+        elif not schema_class.model_config.get("use_enum_values"):
+            outer_type_ = _get_outer_type(fieldinfo.annotation)
+            if inspect.isclass(outer_type_) and issubclass(outer_type_, Enum):
+                if isinstance(value, list):
+                    value = [outer_type_(item) for item in value]
+                else:
+                    value = outer_type_(value)
+        values[key] = value
+    return schema_class.model_construct(**values)
+
+
+_bypassed: ContextVar[bool] = ContextVar("djantic_cache_bypassed", default=False)
+
+
+def is_bypassed() -> bool:
+    return _bypassed.get()
+
+
+@contextmanager
+def bypass() -> Iterator[None]:
+    """
+    Read every schema from its objects in the block, without using or storing
+    cached fragments. Fragments do not depend on the validation context, so
+    reads with a context bypass the cache.
+    """
+    token = _bypassed.set(True)
+    try:
+        yield
+    finally:
+        _bypassed.reset(token)
+
+
+def get_cache_key(config: CacheConfig, pk: Any) -> str:
+    return f"{config.prefix}:{pk}"
+
+
+def _get_version(config: CacheConfig, obj: Any) -> Optional[str]:
+    if config.version_field is None:
+        return None
+    version = getattr(obj, config.version_field)
+    if hasattr(version, "isoformat"):
+        return version.isoformat()
+    return str(version)
+
+
+def get_fragments(config: CacheConfig, objs: Sequence[Any]) -> List[Optional[dict]]:
+    """
+    The cached fragment of each object, or None when it is not cached or was
+    cached for another version of the object.
+    """
+    keys = [get_cache_key(config, obj.pk) for obj in objs]
+    entries = caches[config.alias].get_many(keys)
+    fragments: List[Optional[dict]] = []
+    for key, obj in zip(keys, objs):
+        entry = entries.get(key)
+        if entry is not None and entry[0] == _get_version(config, obj):
+            fragments.append(entry[1])
+        else:
+            fragments.append(None)
+    return fragments
+
+
+def set_fragments(config: CacheConfig, items: Sequence[Tuple[Any, dict]]) -> None:
+    entries: Dict[str, list] = {
+        get_cache_key(config, obj.pk): [_get_version(config, obj), fragment]
+        for obj, fragment in items
+    }
+    if entries:
+        caches[config.alias].set_many(entries, timeout=config.timeout)
+
+
+_cached_schemas: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+_dependents: Optional[Dict[type, List[Tuple[Any, str]]]] = None
+
+_lock = threading.Lock()
+
+
+def register_schema(schema_class) -> None:
+    """
+    Invalidate the fragments of `schema_class` when the objects it reads change.
+    """
+    global _dependents
+    with _lock:
+        _cached_schemas.add(schema_class)
+        _dependents = None
+    pre_save.connect(_pre_save, dispatch_uid="djantic_cache_pre_save")
+    post_save.connect(_post_save, dispatch_uid="djantic_cache_post_save")
+    pre_delete.connect(_pre_delete, dispatch_uid="djantic_cache_pre_delete")
+    m2m_changed.connect(_m2m_changed, dispatch_uid="djantic_cache_m2m_changed")
+
+
+def get_dependencies(
+    schema_class, path: Tuple[str, ...] = (), seen: tuple = ()
+) -> List[Tuple[type, str]]:
+    """
+    The models read by the schema, including its nested schemas, each with the
+    lookup from the schema model to the objects read, e.g. `[(Thread, ""),
+    (Message, "messages")]` for a thread schema nesting its messages.
+    """
+    from .main import (
+        _get_django_fields,
+        _get_lookup_fields,
+        _get_nested_schema,
+        _is_pk_list,
+    )
+
+    model = schema_class.model_config["model"]
+    django_fields = _get_django_fields(model)
+    seen = seen + (schema_class,)
+    dependencies = [(model, "__".join(path))]
+
+    for key, fieldinfo in schema_class.model_fields.items():
+        nested_schema, _ = _get_nested_schema(fieldinfo.annotation)
+        if nested_schema is not None:
+            field = django_fields.get(key)
+            if (
+                field is not None
+                and field.related_model is not None
+                and nested_schema not in seen
+            ):
+                dependencies.extend(
+                    get_dependencies(nested_schema, path + (field.name,), seen)
+                )
+            continue
+
+        key = fieldinfo.alias if fieldinfo.alias else key
+        if "__" in key:
+            # Double underscore alias through forward relations
+            lookup = path
+            for lookup_field in (_get_lookup_fields(model, key) or [])[:-1]:
+                lookup = lookup + (lookup_field.name,)
+                dependencies.append((lookup_field.related_model, "__".join(lookup)))
+            continue
+
+        field = django_fields.get(key)
+        if (
+            field is not None
+            and (field.one_to_many or field.many_to_many)
+            and field.related_model is not None
+            and _is_pk_list(fieldinfo.annotation)
+        ):
+            # Lists of primary keys change when related objects are added or deleted
+            dependencies.append((field.related_model, "__".join(path + (field.name,))))
+
+    return dependencies
+
+
+def _get_dependents() -> Dict[type, List[Tuple[Any, str]]]:
+    global _dependents
+    with _lock:
+        if _dependents is None:
+            dependents: Dict[type, List[Tuple[Any, str]]] = {}
+            for schema_class in list(_cached_schemas):
+                for model, path in get_dependencies(schema_class):
+                    entries = dependents.setdefault(model._meta.concrete_model, [])
+                    if (schema_class, path) not in entries:
+                        entries.append((schema_class, path))
+            _dependents = dependents
+        return _dependents
+
+
+def _batches(values: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(values)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def invalidate(model, pks: Iterable[Any], using: str = "default") -> None:
+    """
+    Delete the cached fragments of every schema reading the objects of `model`
+    with these primary keys, directly or through its nested schemas.
+
+    The objects reading them through relations are read and deleted in batches.
+    """
+    dependents = _get_dependents().get(model._meta.concrete_model)
+    pks = [pk for pk in pks if pk is not None]
+    if not dependents or not pks:
+        return
+
+    # Until the change is committed, a concurrent read can cache the old data,
+    # so the keys are deleted again on commit
+    in_atomic_block = transaction.get_connection(using).in_atomic_block
+    keys: Dict[str, Set[str]] = {}
+    for schema_class, path in dependents:
+        config = schema_class.__cache_config__
+        affected: Iterable[Any] = pks
+        if path:
+            manager = schema_class.model_config["model"]._base_manager
+            affected = (
+                manager.using(using)
+                .filter(**{f"{path}__pk__in": pks})
+                .values_list("pk", flat=True)
+                .iterator(chunk_size=INVALIDATE_BATCH_SIZE)
+            )
+        for batch in _batches(affected, INVALIDATE_BATCH_SIZE):
+            batch_keys = [get_cache_key(config, pk) for pk in batch]
+            caches[config.alias].delete_many(batch_keys)
+            if in_atomic_block:
+                keys.setdefault(config.alias, set()).update(batch_keys)
+
+    def delete() -> None:
+        for alias, alias_keys in keys.items():
+            caches[alias].delete_many(list(alias_keys))
+
+    if keys:
+        transaction.on_commit(delete, using=using)
+
+
+def _foreign_key_changed(sender, instance, using: str, update_fields) -> bool:
+    """
+    Whether saving the instance changes one of its foreign keys, which changes
+    the objects reading it through relations.
+    """
+    fields = [
+        field
+        for field in sender._meta.concrete_fields
+        if field.many_to_one or field.one_to_one
+    ]
+    if update_fields is not None:
+        fields = [
+            field
+            for field in fields
+            if field.name in update_fields or field.attname in update_fields
+        ]
+    if not fields:
+        return False
+    attnames = [field.attname for field in fields]
+    saved = (
+        sender._base_manager.using(using)
+        .filter(pk=instance.pk)
+        .values_list(*attnames)
+        .first()
+    )
+    return saved is not None and saved != tuple(
+        getattr(instance, attname) for attname in attnames
+    )
+
+
+def _pre_save(
+    sender, instance, raw=False, using="default", update_fields=None, **kwargs
+) -> None:
+    # The objects related to the instance before it changes, e.g. the thread a
+    # message is moved from. post_save finds them when no foreign key changes.
+    if raw or instance._state.adding:
+        return
+    dependents = _get_dependents().get(sender._meta.concrete_model, [])
+    if any(path for _, path in dependents) and _foreign_key_changed(
+        sender, instance, using, update_fields
+    ):
+        invalidate(sender, [instance.pk], using)
+
+
+def _post_save(sender, instance, raw=False, using="default", **kwargs) -> None:
+    if not raw:
+        invalidate(sender, [instance.pk], using)
+
+
+def _pre_delete(sender, instance, using="default", **kwargs) -> None:
+    # Related objects are looked up before the relations are deleted
+    invalidate(sender, [instance.pk], using)
+
+
+def _get_m2m_lookup(model, through, target) -> Optional[str]:
+    for field in model._meta.get_fields():
+        if not field.many_to_many or field.related_model is not target:
+            continue
+        rel = field.remote_field if field.concrete else field
+        if getattr(rel, "through", None) is through:
+            return field.name
+    return None
+
+
+def _m2m_changed(
+    sender, instance, action, model, pk_set, using="default", **kwargs
+) -> None:
+    # Look the relation up both before objects are removed and after they are
+    # added, so objects reading it through other relations are found
+    if action in ("post_add", "pre_remove"):
+        invalidate(type(instance), [instance.pk], using)
+        invalidate(model, pk_set or (), using)
+    elif action == "pre_clear":
+        invalidate(type(instance), [instance.pk], using)
+        lookup = _get_m2m_lookup(model, sender, type(instance)._meta.concrete_model)
+        if lookup is not None:
+            pks = model._base_manager.using(using).filter(**{lookup: instance.pk})
+            invalidate(model, list(pks.values_list("pk", flat=True)), using)
@@ -0,0 +1,138 @@
+import math
+import multiprocessing
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import django
+from django.db import connections
+from django.db.models import Max, Min, QuerySet
+from django.db.models.query import ModelIterable
+
+
+def _init_worker(databases: Dict[str, Any]) -> None:
+    # Processes started with "spawn" import the settings module again, use the
+    # databases of the calling process, e.g. test databases
+    django.setup()
+    for alias, name in databases.items():
+        connections[alias].settings_dict["NAME"] = name
+
+
+def _get_ranges(low: int, high: int, chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split the values from `low` to `high` included into at most `chunks` half-open
+    ranges.
+    """
+    step = max(math.ceil((high + 1 - low) / chunks), 1)
+    return [
+        (start, min(start + step, high + 1)) for start in range(low, high + 1, step)
+    ]
+
+
+def _export_range(
+    schema_class,
+    queryset_class: Type[QuerySet],
+    model,
+    query,
+    using: str,
+    prefetch_related: Sequence[Any],
+    chunk_by: str,
+    bounds: Tuple[int, int],
+    path: Optional[str],
+    context: Optional[dict],
+    optimize: bool,
+) -> Union[list, str]:
+    queryset = queryset_class(model=model, query=query, using=using)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    queryset = queryset.filter(
+        **{f"{chunk_by}__gte": bounds[0], f"{chunk_by}__lt": bounds[1]}
+    )
+    try:
+        objs = schema_class.iter_from_django(
+            queryset, context=context, optimize=optimize
+        )
+        if path is None:
+            return list(objs)
+
+        with open(path, "w") as f:
+            for obj in objs:
+                f.write(obj.model_dump_json())
+                f.write("\n")
+        return path
+    finally:
+        # The worker uses its own connections, do not leave them open
+        connections.close_all()
+
+
+def parallel_export(
+    schema_class,
+    queryset: QuerySet,
+    workers: Optional[int] = None,
+    chunk_by: str = "pk",
+    chunks: Optional[int] = None,
+    output: Optional[str] = None,
+    context: Optional[dict] = None,
+    optimize: bool = False,
+    executor: Optional[Executor] = None,
+) -> List[Any]:
+    if queryset.query.is_sliced:
+        raise ValueError("parallel_export does not support sliced querysets.")
+    if queryset._iterable_class is not ModelIterable:
+        raise ValueError(
+            "parallel_export does not support values() or values_list() querysets."
+        )
+    try:
+        pickle.dumps(schema_class)
+    except (pickle.PicklingError, AttributeError) as e:
+        raise ValueError(
+            f"{schema_class.__qualname__} must be defined at the top level of a "
+            "module, so worker processes can import it."
+        ) from e
+
+    bounds = queryset.aggregate(low=Min(chunk_by), high=Max(chunk_by))
+    if bounds["low"] is None:
+        return []
+    if not isinstance(bounds["low"], int):
+        raise ValueError(f"parallel_export can only split on integers, not {chunk_by}.")
+
+    workers = workers or multiprocessing.cpu_count()
+    ranges = _get_ranges(bounds["low"], bounds["high"], chunks or workers * 4)
+    paths = [None] * len(ranges)
+    if output is not None:
+        paths = [output.format(shard=shard) for shard in range(len(ranges))]
+
+    pool = executor or ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(
+            {alias: connections[alias].settings_dict["NAME"] for alias in connections},
+        ),
+    )
+    try:
+        futures = [
+            pool.submit(
+                _export_range,
+                schema_class,
+                type(queryset),
+                queryset.model,
+                queryset.query,
+                queryset.db,
+                queryset._prefetch_related_lookups,
+                chunk_by,
+                chunk,
+                path,
+                context,
+                optimize,
+            )
+            for chunk, path in zip(ranges, paths)
+        ]
+        results = [future.result() for future in futures]
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+    if output is not None:
+        return results
+    return [obj for result in results for obj in result]
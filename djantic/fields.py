@@ -1,8 +1,9 @@
 import logging
+from copy import copy
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Dict, List, Optional, Type, Union
 import typing
 from uuid import UUID
 
@@ -74,30 +75,101 @@ FIELD_TYPES = {
 }
 
 
+PYTHON_TYPES: Dict[str, Any] = {
+    **dict.fromkeys(STR_TYPES, str),
+    **dict.fromkeys(INT_TYPES, int),
+    **FIELD_TYPES,
+}
+
+_registered_field_types: Dict[type, Any] = {}
+
+_internal_type_cache: Dict[tuple, Any] = {}
+
+_field_cache: Dict[Any, tuple] = {}
+
+
+def register_field_type(field_class: type, python_type: Any) -> None:
+    """
+    Declare the Python type used for a custom Django field class and its subclasses.
+
+    Registered types take precedence over the type of the field's internal type.
+    """
+    _registered_field_types[field_class] = python_type
+    _internal_type_cache.clear()
+    _field_cache.clear()
+
+
 def get_internal_type(field):
-    python_type = None
     internal_type = field.get_internal_type()
-    if internal_type in STR_TYPES:
-        python_type = str
+    key = (type(field), internal_type)
+    try:
+        return _internal_type_cache[key]
+    except KeyError:
+        python_type = _internal_type_cache[key] = _resolve_internal_type(*key)
+        return python_type
+
+
+def _resolve_internal_type(field_class: type, internal_type: str) -> Any:
+    for klass in field_class.__mro__:
+        if klass in _registered_field_types:
+            return _registered_field_types[klass]
 
-    elif internal_type in INT_TYPES:
-        python_type = int
+    if internal_type in PYTHON_TYPES:
+        return PYTHON_TYPES[internal_type]
 
-    elif internal_type in FIELD_TYPES:
-        python_type = FIELD_TYPES[internal_type]
+    # A field reporting an unknown internal type, e.g. a subclass overriding
+    # `get_internal_type`, falls back to the closest known base class.
+    for klass in field_class.__mro__:
+        if klass.__name__ in PYTHON_TYPES:
+            return PYTHON_TYPES[klass.__name__]
+    return None
 
-    else:  # pragma: nocover
-        for field_class in type(field).__mro__:
-            get_internal_type = getattr(field_class, "get_internal_type", None)
-            if get_internal_type:
-                _internal_type = get_internal_type(field_class())
-                if _internal_type in FIELD_TYPES:
-                    python_type = FIELD_TYPES[_internal_type]
-                    break
-    return python_type
+
+_enum_cache: Dict[tuple, Type[Enum]] = {}
+
+
+def get_choices_enum(field: Any) -> Type[Enum]:
+    """
+    The Enum for the choices of a field. It is shared by every schema using the
+    field, and named after its model and field, e.g. `PreferencePreferredFoodEnum`.
+    """
+    enum_choices = {}
+    for k, v in field.choices:
+        if Promise in type(v).__mro__:
+            v = str(v)
+        enum_choices[v] = k
+    if field.blank:
+        enum_choices["_blank"] = ""
+
+    key = (field.model, field.name, tuple(enum_choices.items()))
+    try:
+        return _enum_cache[key]
+    except KeyError:
+        enum_prefix = f"{field.model.__name__}{field.name.title().replace('_', '')}"
+        python_type = _enum_cache[key] = Enum(  # type: ignore
+            f"{enum_prefix}Enum",
+            enum_choices,
+            module=__name__,
+        )
+        return python_type
 
 
 def ModelSchemaField(field: Any, schema_name: str) -> tuple:
+    """
+    Convert a Django field into a `(python_type, FieldInfo)` pair for a schema.
+
+    Conversions are cached for the process, so the same field used in several
+    schemas is only converted once. `schema_name` is kept for compatibility, the
+    conversion no longer depends on the schema.
+    """
+    try:
+        python_type, field_info = _field_cache[field]
+    except KeyError:
+        python_type, field_info = _field_cache[field] = _model_schema_field(field)
+    return python_type, copy(field_info)
+
+
+def _model_schema_field(field: Any) -> tuple:
     default = Required
     default_factory = None
     description = None
@@ -122,7 +194,7 @@ def ModelSchemaField(field: Any, schema_name: str) -> tuple:
             if not field.concrete and field.auto_created or field.null:
                 default = None
 
-        pk_type = FIELD_TYPES.get(internal_type, int)
+        pk_type = PYTHON_TYPES.get(internal_type, int)
         if field.one_to_many or field.many_to_many:
             python_type = List[Dict[str, pk_type]]
         else:
@@ -133,22 +205,7 @@ def ModelSchemaField(field: Any, schema_name: str) -> tuple:
 
     else:
         if field.choices:
-            enum_choices = {}
-            for k, v in field.choices:
-                if Promise in type(v).__mro__:
-                    v = str(v)
-                enum_choices[v] = k
-            if field.blank:
-                enum_choices["_blank"] = ""
-
-            enum_prefix = (
-                f"{schema_name.replace('_', '')}{field.name.title().replace('_', '')}"
-            )
-            python_type = Enum(  # type: ignore
-                f"{enum_prefix}Enum",
-                enum_choices,
-                module=__name__,
-            )
+            python_type = get_choices_enum(field)
 
             if field.has_default() and isinstance(field.default, Enum):
                 default = field.default.value
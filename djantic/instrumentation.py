@@ -0,0 +1,308 @@
+import functools
+import logging
+import math
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from django.db import connections
+
+logger = logging.getLogger("djantic")
+
+
+@dataclass
+class SchemaQueries:
+    """
+    The SQL queries issued by one `from_django` call. `relations` counts the
+    queries issued while reading each relation path, and `reads` how many times
+    the path was read.
+    """
+
+    schema: str
+    rows: int = 0
+    queries: int = 0
+    relations: Dict[str, int] = field(default_factory=dict)
+    reads: Dict[str, int] = field(default_factory=dict)
+
+
+class QueryTracker:
+    """
+    Count the queries of the `from_django` calls made while it is active, see
+    `track_queries`.
+    """
+
+    def __init__(self) -> None:
+        self.calls: List[SchemaQueries] = []
+        self._current: Optional[SchemaQueries] = None
+        self._path: List[Tuple[Any, str]] = []
+        self._lookups: Dict[str, Tuple[Tuple[Any, str], ...]] = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        current = self._current
+        if current is not None:
+            current.queries += 1
+            if self._path:
+                path = _get_path(self._path)
+                current.relations[path] = current.relations.get(path, 0) + 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def track(self, schema_class) -> Iterator[SchemaQueries]:
+        if self._current is not None:
+            # Nested from_django call, counted with the outer one
+            yield self._current
+            return
+
+        self._current = SchemaQueries(schema=schema_class.__name__)
+        try:
+            yield self._current
+        finally:
+            call, self._current = self._current, None
+            self.calls.append(call)
+        self._warn_per_row_queries(call)
+
+    def run_read_plan(self, schema_class, obj: Any) -> dict:
+        result = {}
+        reads = self._current.reads if self._current is not None else {}
+        for key, getter in schema_class.__read_plan__:
+            self._path.append((schema_class, key))
+            path = _get_path(self._path)
+            reads[path] = reads.get(path, 0) + 1
+            self._lookups.setdefault(path, tuple(self._path))
+            try:
+                result[key] = getter(obj)
+            finally:
+                self._path.pop()
+        return result
+
+    def _warn_per_row_queries(self, call: SchemaQueries) -> None:
+        for path, queries in call.relations.items():
+            reads = call.reads.get(path, 0)
+            if reads < 2 or queries < reads:
+                continue
+
+            method, lookup = _suggest_lookup(self._lookups[path])
+            logger.warning(
+                "%s.%s issued %d queries for %d reads, load it with %s(%r).",
+                call.schema,
+                path,
+                queries,
+                reads,
+                method,
+                lookup,
+                extra={
+                    "schema": call.schema,
+                    "field": path,
+                    "queries": queries,
+                    "reads": reads,
+                    "suggestion": {"method": method, "lookup": lookup},
+                },
+            )
+
+
+def _get_path(path: List[Tuple[Any, str]]) -> str:
+    return "__".join(key for _, key in path)
+
+
+def _suggest_lookup(path: Tuple[Tuple[Any, str], ...]) -> Tuple[str, str]:
+    from .main import _get_django_fields
+
+    keys = []
+    single_valued = True
+    for schema_class, key in path:
+        if "__" in key:
+            # Double underscore alias through forward relations
+            keys.append(key.rsplit("__", 1)[0])
+            continue
+
+        keys.append(key)
+        field = _get_django_fields(schema_class.model_config["model"]).get(key)
+        if field is None or not (
+            field.one_to_one or (field.many_to_one and field.concrete)
+        ):
+            single_valued = False
+
+    method = "select_related" if single_valued else "prefetch_related"
+    return method, "__".join(keys)
+
+
+_query_tracker: ContextVar[Optional[QueryTracker]] = ContextVar(
+    "djantic_query_tracker", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryTracker]:
+    """
+    Record the SQL queries issued by every `from_django` call in the block, broken
+    down by relation path, and log a warning for relations queried once per row:
+
+        with track_queries() as tracker:
+            UserSchema.from_django(User.objects.all(), many=True)
+        tracker.calls  # [SchemaQueries(schema="UserSchema", queries=11, ...)]
+    """
+    tracker = QueryTracker()
+    token = _query_tracker.set(tracker)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(tracker))
+            yield tracker
+    finally:
+        _query_tracker.reset(token)
+
+
+class Observer:
+    """
+    Receives the timings of djantic operations, register it with `add_observer`.
+
+    Events are `from_django`, `extract` (reading the rows, including fetching
+    them), `validate`, `nested` (reading a nested schema relation of a row),
+    `create`, `update`, `save`, `bulk_save`, `bulk_save_batch` (one batch of
+    `bulk_save`) and `bulk_update`.
+
+    Subclasses override `observe`, which ignores the timings by default.
+    """
+
+    def observe(
+        self, event: str, schema: str, rows: int, duration: float, queries: int
+    ) -> None:
+        """Called with the timing of every operation, once it completed."""
+
+
+_observers: List[Observer] = []
+
+
+def add_observer(observer: Observer) -> None:
+    _observers.append(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    _observers.remove(observer)
+
+
+class _QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+_query_counter: ContextVar[Optional[_QueryCounter]] = ContextVar(
+    "djantic_query_counter", default=None
+)
+
+
+@dataclass
+class Observation:
+    rows: int = 0
+
+
+@contextmanager
+def observe(event: str, schema_class, rows: int = 0) -> Iterator[Observation]:
+    """
+    Time the block, count its queries and report them to the observers. The
+    block can set the number of rows it handled on the returned `Observation`.
+    """
+    observation = Observation(rows)
+    counter = _query_counter.get()
+    with ExitStack() as stack:
+        if counter is None:
+            counter = _QueryCounter()
+            token = _query_counter.set(counter)
+            stack.callback(_query_counter.reset, token)
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+
+        queries = counter.count
+        start = time.perf_counter()
+        yield observation
+        duration = time.perf_counter() - start
+        queries = counter.count - queries
+
+    for observer in list(_observers):
+        observer.observe(
+            event, schema_class.__name__, observation.rows, duration, queries
+        )
+
+
+def observed(event: str) -> Callable:
+    """
+    Report the calls of a schema method to the observers, with the number of
+    records it returns as rows.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self_or_cls, *args: Any, **kwargs: Any) -> Any:
+            if not _observers:
+                return method(self_or_cls, *args, **kwargs)
+
+            schema_class = (
+                self_or_cls if isinstance(self_or_cls, type) else type(self_or_cls)
+            )
+            with observe(event, schema_class) as observation:
+                result = method(self_or_cls, *args, **kwargs)
+                observation.rows = len(result) if isinstance(result, list) else 1
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class HistogramObserver(Observer):
+    """
+    Keep the durations in memory and report percentiles per schema and event:
+
+        observer = HistogramObserver()
+        add_observer(observer)
+        ...
+        observer.report()
+        # {"UserSchema": {"from_django": {"count": 10, "rows": 250, "queries": 20,
+        #                                 "p50": 0.0021, "p90": 0.0034, "p99": 0.0051}}}
+    """
+
+    def __init__(self, percentiles: Sequence[float] = (50, 90, 99)) -> None:
+        self.percentiles = tuple(percentiles)
+        self._lock = threading.Lock()
+        self._durations: Dict[Tuple[str, str], List[float]] = {}
+        self._totals: Dict[Tuple[str, str], List[int]] = {}
+
+    def observe(
+        self, event: str, schema: str, rows: int, duration: float, queries: int
+    ) -> None:
+        key = (schema, event)
+        with self._lock:
+            self._durations.setdefault(key, []).append(duration)
+            totals = self._totals.setdefault(key, [0, 0])
+            totals[0] += rows
+            totals[1] += queries
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        report: Dict[str, Dict[str, Dict[str, float]]] = {}
+        with self._lock:
+            for (schema, event), durations in self._durations.items():
+                rows, queries = self._totals[(schema, event)]
+                stats: Dict[str, float] = {
+                    "count": len(durations),
+                    "rows": rows,
+                    "queries": queries,
+                }
+                ordered = sorted(durations)
+                for percentile in self.percentiles:
+                    # Nearest rank
+                    rank = max(math.ceil(percentile / 100 * len(ordered)), 1)
+                    stats[f"p{percentile:g}"] = ordered[rank - 1]
+                report.setdefault(schema, {})[event] = stats
+        return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._durations.clear()
+            self._totals.clear()
@@ -1,21 +1,60 @@
 import inspect
 import sys
+import threading
+from concurrent.futures import Executor
+from contextlib import ExitStack
+from copy import deepcopy
 from enum import Enum
 from functools import reduce
-from itertools import chain
-from typing import Any, Dict, List, Optional, TypeVar, Union, no_type_check
+from itertools import chain, islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    no_type_check,
+)
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import Manager, Model
-from django.db.models.fields.files import ImageFieldFile
+from django.db.models import (
+    Manager,
+    Model,
+    Prefetch,
+    QuerySet,
+    prefetch_related_objects,
+)
+from django.db.models.fields.files import ImageField, ImageFieldFile
 from django.db.models.fields.reverse_related import ForeignObjectRel, OneToOneRel
+from django.db.models.query import ModelIterable
 from django.utils.encoding import force_str
 from django.utils.functional import Promise
 from pydantic import BaseModel, create_model
 from pydantic._internal._model_construction import ModelMetaclass
 from pydantic.errors import PydanticUserError
+from pydantic.json_schema import (
+    DEFAULT_REF_TEMPLATE,
+    GenerateJsonSchema,
+    JsonSchemaMode,
+    models_json_schema,
+)
 from typing_extensions import get_args, get_origin
 
+try:
+    from django.db.models import aprefetch_related_objects
+except ImportError:  # Django < 5.0
+    aprefetch_related_objects = sync_to_async(prefetch_related_objects)
+
 if sys.version_info >= (3, 10):
     from types import UnionType
 else:
@@ -24,11 +63,25 @@ else:
 
 from django.db.models import Model as DjangoModel
 
-from .fields import ModelSchemaField
+from .cache import (
+    bypass,
+    dump_fragment,
+    get_cache_config,
+    get_fragments,
+    is_bypassed,
+    load_fragment,
+    register_schema,
+    set_fragments,
+)
+from .export import parallel_export
+from .fields import ModelSchemaField, get_internal_type
+from .instrumentation import _observers, _query_tracker, observe
 from .mixin import ModelSchemaMixin
 
 _is_base_model_class_defined = False
 
+_rebuild_lock = threading.RLock()
+
 _M = TypeVar("_M", bound=DjangoModel)
 
 
@@ -50,9 +103,25 @@ def get_field_name(field) -> str:
         return getattr(field, "name", field)
 
 
+def _is_defer_build_configured(bases: tuple, namespace: dict, kwargs: dict) -> bool:
+    return (
+        "defer_build" in kwargs
+        or "defer_build" in namespace.get("model_config", {})
+        or hasattr(namespace.get("Config"), "defer_build")
+        or any("defer_build" in getattr(base, "model_config", {}) for base in bases)
+    )
+
+
 class ModelSchemaMetaclass(ModelMetaclass):
     @no_type_check
     def __new__(mcs, name: str, bases: tuple, namespace: dict, **kwargs):
+        if (
+            _is_base_model_class_defined
+            and not _is_defer_build_configured(bases, namespace, kwargs)
+            and getattr(settings, "DJANTIC_DEFER_BUILD", False)
+        ):
+            kwargs["defer_build"] = True
+
         cls = super().__new__(mcs, name, bases, namespace, **kwargs)
 
         config = namespace.get("model_config", {})
@@ -179,6 +248,8 @@ class ModelSchemaMetaclass(ModelMetaclass):
                     __doc__=cls.__doc__,
                     **field_values,
                 )
+                _compile_schema(model_schema)
+                model_schema.__json_schema_cache__ = {}
 
                 return model_schema
 
@@ -195,87 +266,627 @@ def _is_optional_field(annotation) -> bool:
     )
 
 
+def _get_nested_schema(annotation) -> Tuple[Optional[type], bool]:
+    """
+    Return the nested `ModelSchema` class of a field annotation, if any, and
+    whether it is optional.
+    """
+    if get_origin(annotation) == list:
+        # Pick the underlying annotation
+        annotation = get_args(annotation)[0]
+
+    if _is_optional_field(annotation):
+        non_none_type_annotation = next(
+            arg for arg in get_args(annotation) if arg is not type(None)
+        )
+        return non_none_type_annotation, True
+    elif inspect.isclass(annotation) and issubclass(annotation, ModelSchema):
+        return annotation, False
+    return None, False
+
+
+def _get_django_fields(model) -> Dict[str, Any]:
+    return {get_field_name(f): f for f in model._meta.get_fields()}
+
+
+def _is_pk_list(annotation) -> bool:
+    """
+    Whether the annotation is a list of primary keys, e.g. `List[Dict[str, int]]`.
+    """
+    if get_origin(annotation) is Union or get_origin(annotation) is UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if get_origin(annotation) is not list or not get_args(annotation):
+        return False
+    item = get_args(annotation)[0]
+    return get_origin(item) is dict and get_args(item)[:1] == (str,)
+
+
+def _get_pk_list(manager: Manager) -> List[Dict[str, Any]]:
+    """
+    The primary keys of a related manager, read from its prefetched objects
+    when there are some.
+    """
+    pk_name = manager.model._meta.pk.name
+    queryset = manager.all()
+    if queryset._result_cache is None:
+        return [{pk_name: pk} for pk in queryset.values_list("pk", flat=True)]
+    return [{pk_name: obj.pk} for obj in queryset]
+
+
+def _reads_foreign_key_column(field, annotation) -> bool:
+    """
+    Whether a forward foreign key is typed as the value of its column, e.g. the
+    primary key of the related object, which can then be read without loading it.
+    """
+    if not (field.concrete and (field.many_to_one or field.one_to_one)):
+        return False
+    if not field.target_field.primary_key:
+        # The column holds the `to_field` value rather than the primary key
+        return False
+    outer_type_ = _get_outer_type(annotation)
+    return outer_type_ is int or outer_type_ == get_internal_type(field.target_field)
+
+
+def _get_outer_type(annotation):
+    typing_args = get_args(annotation)
+    typing_origin = get_origin(annotation)
+    if typing_origin == Union:
+        return typing_args[0]
+    elif typing_origin is None:
+        return annotation
+    elif typing_args[0] == List:
+        return typing_origin
+    return typing_args[0]
+
+
+def _compile_value_getter(
+    schema_class,
+    key: str,
+    annotation=None,
+    django_fields: Optional[Dict[str, Any]] = None,
+) -> Callable:
+    """
+    Build a getter that reads `key` from a Django object and converts the value
+    into something the schema field accepts. Everything that only depends on
+    the schema class is resolved here, once, rather than for every row.
+    """
+    if django_fields is None:
+        django_fields = _get_django_fields(schema_class.model_config["model"])
+    if annotation is None:
+        alias = schema_class.__alias_map__[key]
+        annotation = schema_class.model_fields[alias].annotation
+
+    outer_type_ = _get_outer_type(annotation)
+    is_pk_list = _is_pk_list(annotation)
+    is_int = outer_type_ == int
+    is_str = inspect.isclass(outer_type_) and issubclass(outer_type_, str)
+
+    if "__" in key:
+        # Allow double underscores aliases: first_name: str = Field(alias="user__first_name")
+        keys_map = key.split("__")
+
+        def resolve(obj):
+            return reduce(lambda a, b: getattr(a, b, None), keys_map, obj)
+
+        django_field = None
+    else:
+
+        def resolve(obj):
+            return getattr(obj, key, None)
+
+        django_field = django_fields.get(key)
+
+    if django_field is not None and django_field.is_relation:
+        if django_field.one_to_many or django_field.many_to_many:
+
+            def get_manager(obj):
+                attr = resolve(obj)
+                if isinstance(attr, Manager):
+                    if is_pk_list:
+                        return _get_pk_list(attr)
+                    return list(attr.all())
+                return attr
+
+            return get_manager
+
+        if _reads_foreign_key_column(django_field, annotation):
+            attname = django_field.attname
+
+            def get_foreign_key(obj):
+                if isinstance(obj, Model):
+                    return getattr(obj, attname)
+                attr = resolve(obj)
+                if is_int and isinstance(attr, Model):
+                    return attr.id
+                return attr
+
+            return get_foreign_key
+
+        if is_int:
+
+            def get_related_id(obj):
+                attr = resolve(obj)
+                if isinstance(attr, Model):
+                    return attr.id
+                return attr
+
+            return get_related_id
+
+        return resolve
+
+    if django_field is not None and not isinstance(django_field, ImageField):
+
+        def get_value(obj):
+            attr = resolve(obj)
+            if isinstance(attr, Enum):
+                return attr.value
+            return attr
+
+        return get_value
+
+    def get(obj):
+        attr = resolve(obj)
+        if isinstance(attr, Manager):
+            if is_pk_list:
+                return _get_pk_list(attr)
+            return list(attr.all())
+        elif is_int and isinstance(attr, Model):
+            return attr.id
+        elif isinstance(attr, Enum):
+            return attr.value
+        elif is_str and isinstance(attr, ImageFieldFile):
+            return attr.name
+        return attr
+
+    return get
+
+
+def _compile_nested_getter(
+    value_getter: Callable, schema_class, optional: bool
+) -> Callable:
+    def get_nested(obj):
+        if _observers:
+            with observe("nested", schema_class) as observation:
+                value = read_nested(obj)
+                if isinstance(value, list):
+                    observation.rows = len(value)
+                else:
+                    observation.rows = int(value is not None)
+            return value
+        return read_nested(obj)
+
+    def read_nested(obj):
+        value = value_getter(obj)
+        if optional and value is None:
+            return None
+        cached = schema_class.__cache_config__ is not None and not is_bypassed()
+        if isinstance(value, list):
+            if cached and all(isinstance(o, Model) for o in value):
+                return _read_cached(schema_class, value)
+            return [_run_read_plan(schema_class, o) for o in value]
+        if cached and isinstance(value, Model):
+            return _read_cached(schema_class, [value])[0]
+        return _run_read_plan(schema_class, value)
+
+    return get_nested
+
+
+def _compile_read_plan(schema_class) -> Tuple[Tuple[str, Callable], ...]:
+    """
+    Compile the ordered (key, getter) pairs used to extract the data for
+    `schema_class` from a Django object.
+    """
+    django_fields = _get_django_fields(schema_class.model_config["model"])
+    plan = []
+    for key, fieldinfo in schema_class.model_fields.items():
+        nested_schema, optional = _get_nested_schema(fieldinfo.annotation)
+        if nested_schema is not None:
+            getter = _compile_nested_getter(
+                _compile_value_getter(
+                    schema_class, key, fieldinfo.annotation, django_fields
+                ),
+                nested_schema,
+                optional=optional,
+            )
+        else:
+            key = fieldinfo.alias if fieldinfo.alias else key
+            getter = _compile_value_getter(
+                schema_class, key, fieldinfo.annotation, django_fields
+            )
+        plan.append((key, getter))
+    return tuple(plan)
+
+
+def _compile_schema(schema_class) -> None:
+    """
+    Compile what `from_django` needs to read objects for `schema_class`. This
+    depends on the field annotations, so it runs again when `model_rebuild`
+    resolves forward references.
+    """
+    schema_class.__read_plan__ = _compile_read_plan(schema_class)
+    schema_class.__values_fields__ = _get_values_fields(schema_class)
+    schema_class.__cache_config__ = get_cache_config(schema_class)
+    if schema_class.__cache_config__ is not None:
+        register_schema(schema_class)
+
+
+def _get_related_lookups(
+    schema_class, prefix: str = "", prefetch: bool = False, seen: tuple = ()
+) -> Tuple[List[str], List[str]]:
+    """
+    Walk the nested schemas of `schema_class` and collect the `select_related`
+    and `prefetch_related` lookups needed to load them.
+    """
+    select_related: List[str] = []
+    prefetch_related: List[str] = []
+    django_fields = _get_django_fields(schema_class.model_config["model"])
+    seen = seen + (schema_class,)
+
+    for key, fieldinfo in schema_class.model_fields.items():
+        nested_schema, _ = _get_nested_schema(fieldinfo.annotation)
+        field = django_fields.get(key)
+        if nested_schema is None or field is None or nested_schema in seen:
+            continue
+
+        lookup = f"{prefix}{key}"
+        single_valued = field.one_to_one or (field.many_to_one and field.concrete)
+        nested_prefetch = prefetch or not single_valued
+        if nested_prefetch:
+            prefetch_related.append(lookup)
+        else:
+            select_related.append(lookup)
+
+        nested_select, nested_prefetch_related = _get_related_lookups(
+            nested_schema, f"{lookup}__", nested_prefetch, seen
+        )
+        select_related.extend(nested_select)
+        prefetch_related.extend(nested_prefetch_related)
+
+    return select_related, prefetch_related
+
+
+def _get_pk_list_lookups(
+    schema_class, prefix: str = "", seen: tuple = ()
+) -> List[Tuple[str, Any, List[str]]]:
+    """
+    Walk `schema_class` and its nested schemas and collect the relations read as
+    lists of primary keys, with the related model and the columns needed to
+    prefetch them.
+    """
+    lookups = []
+    django_fields = _get_django_fields(schema_class.model_config["model"])
+    seen = seen + (schema_class,)
+
+    for key, fieldinfo in schema_class.model_fields.items():
+        nested_schema, _ = _get_nested_schema(fieldinfo.annotation)
+        if nested_schema is not None:
+            if key in django_fields and nested_schema not in seen:
+                lookups.extend(
+                    _get_pk_list_lookups(nested_schema, f"{prefix}{key}__", seen)
+                )
+            continue
+
+        key = fieldinfo.alias if fieldinfo.alias else key
+        field = django_fields.get(key)
+        if (
+            field is None
+            or not (field.one_to_many or field.many_to_many)
+            or not _is_pk_list(fieldinfo.annotation)
+        ):
+            continue
+
+        related_model = field.related_model
+        only = [related_model._meta.pk.name]
+        if hasattr(field, "object_id_field_name"):
+            # GenericRelation
+            only.extend([field.object_id_field_name, field.content_type_field_name])
+        elif field.one_to_many and not field.concrete:
+            # Reverse ForeignKey, the prefetch matches on the foreign key column
+            only.append(field.field.name)
+        lookups.append((f"{prefix}{key}", related_model, only))
+
+    return lookups
+
+
+def _get_pk_list_prefetches(
+    schema_class, queryset: Optional[QuerySet] = None
+) -> List[Union[str, Prefetch]]:
+    """
+    The lookups prefetching every list of primary keys read by the schema, so they
+    are loaded with one query per relation instead of one per row.
+
+    For a queryset they only load the primary keys, and skip the relations the
+    queryset already prefetches. Lists of instances belong to the caller, and are
+    prefetched with complete objects.
+    """
+    lookups = _get_pk_list_lookups(schema_class)
+    if queryset is None:
+        return [lookup for lookup, _, _ in lookups]
+
+    done = {
+        getattr(lookup, "prefetch_to", lookup)
+        for lookup in queryset._prefetch_related_lookups
+    }
+    return [
+        Prefetch(lookup, queryset=model._default_manager.only(*only))
+        for lookup, model, only in lookups
+        if lookup not in done
+    ]
+
+
+def _get_batch_lookups(
+    schema_class, queryset: Optional[QuerySet] = None
+) -> List[Union[str, Prefetch]]:
+    """
+    The lookups loading the relations read by the schema for all the objects of a
+    `many=True` call at once, with one query per relation and level instead of
+    one per object. They work on querysets and on lists of instances.
+
+    Relations the queryset already prefetches are skipped, and the ones it
+    selects are not queried again.
+    """
+    lookups: List[Union[str, Prefetch]] = list(
+        chain(*_get_related_lookups(schema_class))
+    )
+    if queryset is not None:
+        done = {
+            getattr(lookup, "prefetch_to", lookup)
+            for lookup in queryset._prefetch_related_lookups
+        }
+        lookups = [lookup for lookup in lookups if lookup not in done]
+    return lookups + _get_pk_list_prefetches(schema_class, queryset)
+
+
+def _get_lookup_fields(model, lookup: str) -> Optional[List[Any]]:
+    """
+    Resolve a double underscore lookup into the fields it traverses, or None when
+    it does not follow forward relations to a concrete field.
+    """
+    fields = []
+    for name in lookup.split("__"):
+        if fields:
+            if not (fields[-1].many_to_one or fields[-1].one_to_one):
+                return None
+            model = fields[-1].related_model
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        fields.append(field)
+    return fields
+
+
+def _get_only_fields(
+    schema_class, select_related: dict, prefix: str = ""
+) -> Optional[List[str]]:
+    """
+    Collect the `only()` lookups covering every column the schema reads, or None
+    when the schema reads attributes that can not be mapped to columns.
+    """
+    model = schema_class.model_config["model"]
+    django_fields = _get_django_fields(model)
+    only: List[str] = []
+
+    for key, fieldinfo in schema_class.model_fields.items():
+        nested_schema, _ = _get_nested_schema(fieldinfo.annotation)
+        if nested_schema is None and fieldinfo.alias:
+            key = fieldinfo.alias
+
+        if "__" in key:
+            if _get_lookup_fields(model, key) is None:
+                return None
+            only.append(f"{prefix}{key}")
+            continue
+
+        field = django_fields.get(key)
+        if field is None:
+            return None
+        if field.one_to_many or field.many_to_many:
+            continue
+        if hasattr(field, "ct_field") and hasattr(field, "fk_field"):
+            # GenericForeignKey
+            only.extend([f"{prefix}{field.ct_field}", f"{prefix}{field.fk_field}"])
+            continue
+
+        only.append(f"{prefix}{key}")
+        if nested_schema is not None and key in select_related:
+            nested_only = _get_only_fields(
+                nested_schema, select_related[key], f"{prefix}{key}__"
+            )
+            only.extend(nested_only or [])
+
+    # The version of cached fragments is read with the object
+    config = getattr(schema_class, "__cache_config__", None)
+    if config is not None and config.version_field is not None:
+        if f"{prefix}{config.version_field}" not in only:
+            only.append(f"{prefix}{config.version_field}")
+
+    # Relations loaded with select_related can not be deferred
+    for key in select_related:
+        if f"{prefix}{key}" not in only:
+            only.append(f"{prefix}{key}")
+
+    return only
+
+
+def _get_values_fields(schema_class) -> Optional[Tuple[str, ...]]:
+    """
+    Return the `values_list()` lookups for a flat schema, one per field, or None
+    when the schema needs model instances (nested schemas, managers, attributes
+    that are not columns).
+    """
+    model = schema_class.model_config["model"]
+    django_fields = _get_django_fields(model)
+    keys = []
+    for key, fieldinfo in schema_class.model_fields.items():
+        nested_schema, _ = _get_nested_schema(fieldinfo.annotation)
+        if nested_schema is not None:
+            return None
+
+        key = fieldinfo.alias if fieldinfo.alias else key
+        if "__" in key:
+            if _get_lookup_fields(model, key) is None:
+                return None
+        else:
+            field = django_fields.get(key)
+            if field is None or not field.concrete or field.many_to_many:
+                return None
+        keys.append(key)
+    return tuple(keys)
+
+
+def _reads_unloaded_relations(schema_class, seen: tuple = ()) -> bool:
+    """
+    Whether extracting the data for `schema_class` can query the database for
+    relations that `optimize_queryset` does not load, or read the fragments of
+    nested schemas from their cache backend.
+    """
+    django_fields = _get_django_fields(schema_class.model_config["model"])
+    seen = seen + (schema_class,)
+    for key, fieldinfo in schema_class.model_fields.items():
+        nested_schema, _ = _get_nested_schema(fieldinfo.annotation)
+        if nested_schema is not None:
+            if nested_schema.__cache_config__ is not None:
+                return True
+            if nested_schema not in seen and _reads_unloaded_relations(
+                nested_schema, seen
+            ):
+                return True
+            continue
+
+        key = fieldinfo.alias if fieldinfo.alias else key
+        field = django_fields.get(key)
+        if "__" in key or field is None:
+            # Properties and other attributes can query the database
+            return True
+        if field.is_relation:
+            # Lists of primary keys are prefetched, foreign keys read their column
+            if not (
+                (field.one_to_many or field.many_to_many)
+                and _is_pk_list(fieldinfo.annotation)
+            ) and not _reads_foreign_key_column(field, fieldinfo.annotation):
+                return True
+    return False
+
+
+def _is_model_list(schema_class, objs: list) -> bool:
+    """
+    Whether the relations of `objs` can be prefetched, that is all of them are
+    instances of the schema model rather than arbitrary objects.
+    """
+    model = schema_class.model_config["model"]
+    return all(isinstance(obj, model) for obj in objs)
+
+
+async def _afetch(queryset: QuerySet) -> list:
+    if hasattr(queryset, "__aiter__"):
+        return [obj async for obj in queryset]
+    # Django < 4.1 has no async iteration
+    return await sync_to_async(list)(queryset)
+
+
+def _run_read_plan(schema_class, obj: Any) -> dict:
+    tracker = _query_tracker.get()
+    if tracker is not None:
+        return tracker.run_read_plan(schema_class, obj)
+    return {key: getter(obj) for key, getter in schema_class.__read_plan__}
+
+
+def _read_rows(schema_class, objs: Iterable[Any]) -> Iterator[dict]:
+    # A generator function, so querysets are only fetched once it is consumed
+    for obj in objs:
+        yield _run_read_plan(schema_class, obj)
+
+
+def _read_cached(
+    schema_class, objs: List[Any], context: Any = None, lookups: Sequence = ()
+) -> list:
+    """
+    Build the instances of a schema with `model_config["cache"]`, from the cached
+    fragments of the objects that did not change, without validating them. The
+    other objects are read, after loading `lookups` for them, and validated, and
+    their fragments are cached.
+    """
+    config = schema_class.__cache_config__
+    fragments = get_fragments(config, objs)
+    misses = [obj for obj, fragment in zip(objs, fragments) if fragment is None]
+    if misses and lookups:
+        prefetch_related_objects(misses, *lookups)
+
+    result = []
+    missed = []
+    for obj, fragment in zip(objs, fragments):
+        if fragment is None:
+            instance = schema_class.model_validate(
+                _run_read_plan(schema_class, obj), context=context
+            )
+            missed.append((obj, dump_fragment(instance)))
+        else:
+            instance = load_fragment(schema_class, fragment)
+        result.append(instance)
+    set_fragments(config, missed)
+    return result
+
+
+def _validate_observed(schema_class, data: Iterable[dict], many: bool, context):
+    """
+    Validate the rows read by `from_django`, reporting the extraction and the
+    validation to the observers separately.
+    """
+    with observe("extract", schema_class) as observation:
+        data = list(data)
+        observation.rows = len(data)
+    with observe("validate", schema_class, rows=len(data)):
+        result = [schema_class.model_validate(d, context=context) for d in data]
+    return result if many else result[0]
+
+
+def _filter_json_schema(schema_class, json_schema: dict) -> dict:
+    properties = json_schema.get("properties", {})
+    include = schema_class.model_config.get("include")
+    if include:
+        for key in list(properties.keys()):
+            if key not in include:
+                del properties[key]
+
+    exclude = schema_class.model_config.get("exclude")
+    if exclude:
+        for key in list(properties.keys()):
+            if key in exclude:
+                del properties[key]
+
+    return json_schema
+
+
+# The getters compiled for ProxyGetterNestedObj.get, by (schema class, key)
+_value_getter_cache: Dict[Tuple[Any, str], Callable] = {}
+
+
 class ProxyGetterNestedObj:
     def __init__(self, obj: Any, schema_class):
         self._obj = obj
         self.schema_class = schema_class
 
     def get(self, key: Any, default: Any = None) -> Any:
-        if "__" in key:
-            # Allow double underscores aliases: first_name: str = Field(alias="user__first_name")
-            keys_map = key.split("__")
-            attr = reduce(lambda a, b: getattr(a, b, default), keys_map, self._obj)
-        else:
-            attr = getattr(self._obj, key, None)
-        is_manager = issubclass(attr.__class__, Manager)
-
-        alias = self.schema_class.__alias_map__[key]
-        field = self.schema_class.model_fields[alias]
-
-        typing_args = get_args(field.annotation)
-        typing_origin = get_origin(field.annotation)
-        if typing_origin == Union:
-            outer_type_ = typing_args[0]
-        elif typing_origin is None:
-            outer_type_ = field.annotation
-        # TODO do we have test for a list thingie?
-        elif typing_args[0] == List:
-            outer_type_ = typing_origin
-        elif is_manager and field.annotation == List[Dict[str, int]]:
-            outer_type_ = field.annotation
-        else:
-            outer_type_ = typing_args[0]
-
-        if is_manager and outer_type_ == List[Dict[str, int]]:
-            attr = list(attr.all().values("id"))
-        elif is_manager:
-            attr = list(attr.all())
-        elif outer_type_ == int and issubclass(type(attr), Model):
-            attr = attr.id
-        elif inspect.isclass(type(attr)) and issubclass(type(attr), Enum):
-            attr = attr.value
-        elif issubclass(attr.__class__, ImageFieldFile) and issubclass(
-            outer_type_, str
-        ):
-            attr = attr.name
-        return attr
-
-    def _get_annotation_objects(self, value, annotation):
-        """Value is an object, and the value needs to resolve into a dict"""
-        if isinstance(value, list):
-            return [ProxyGetterNestedObj(o, annotation).dict() for o in value]
-        return ProxyGetterNestedObj(value, annotation).dict()
+        cache_key = (self.schema_class, key)
+        try:
+            getter = _value_getter_cache[cache_key]
+        except KeyError:
+            getter = _value_getter_cache[cache_key] = _compile_value_getter(
+                self.schema_class, key
+            )
+        attr = getter(self._obj)
+        return default if attr is None else attr
 
     def dict(self) -> dict:
         """
         Might not be needed with "from_attributes=True" in model_config
         """
-        fields = self.schema_class.model_fields
-        data = {}
-        for key, fieldinfo in fields.items():
-            annotation = fieldinfo.annotation
-            if get_origin(annotation) == list:
-                # Pick the underlying annotation
-                annotation = get_args(annotation)[0]
-
-            if _is_optional_field(annotation):
-                value = self.get(key)
-                if value is None:
-                    data[key] = None
-                else:
-                    non_none_type_annotation = next(
-                        arg for arg in get_args(annotation) if arg is not type(None)
-                    )
-                    data[key] = self._get_annotation_objects(
-                        value, non_none_type_annotation
-                    )
-
-            elif inspect.isclass(annotation) and issubclass(annotation, ModelSchema):
-                data[key] = self._get_annotation_objects(self.get(key), annotation)
-            else:
-                key = fieldinfo.alias if fieldinfo.alias else key
-                data[key] = self.get(key)
-        return data
+        return _run_read_plan(self.schema_class, self._obj)
 
 
 class ModelSchema(BaseModel, ModelSchemaMixin[_M], metaclass=ModelSchemaMetaclass):
@@ -288,22 +899,54 @@ class ModelSchema(BaseModel, ModelSchemaMixin[_M], metaclass=ModelSchemaMetaclas
             return self.model_dump() == other
         return result
 
+    @classmethod
+    def model_rebuild(
+        cls,
+        *,
+        force: bool = False,
+        raise_errors: bool = True,
+        _parent_namespace_depth: int = 2,
+        _types_namespace: Any = None,
+    ) -> Optional[bool]:
+        """
+        Thread safe `model_rebuild`. Schemas using `defer_build` are built by it on
+        first use, which can happen in several threads at once.
+
+        The read plan is compiled again, with the forward references resolved.
+        """
+        with _rebuild_lock:
+            if "__json_schema_cache__" in cls.__dict__:
+                cls.__json_schema_cache__.clear()
+            result = super().model_rebuild(
+                force=force,
+                raise_errors=raise_errors,
+                _parent_namespace_depth=_parent_namespace_depth + 1,
+                _types_namespace=_types_namespace,
+            )
+            if result and "__read_plan__" in cls.__dict__:
+                _compile_schema(cls)
+            return result
+
     @classmethod
     def model_json_schema(cls, *args, **kwargs):
-        result = super().model_json_schema(*args, **kwargs)
-        if cls.model_config.get("include"):
-            include = cls.model_config.get("include", [])
-            for key in list(result["properties"].keys()):
-                if key not in include:
-                    del result["properties"][key]
+        """
+        The JSON schema of the model, limited to the `include`/`exclude` fields.
 
-        if cls.model_config.get("exclude"):
-            exclude = cls.model_config.get("exclude")
-            for key in list(result["properties"].keys()):
-                if key in exclude:
-                    del result["properties"][key]
+        It is generated once per set of arguments and cached on the class, every
+        call returns a copy of the cached schema.
+        """
+        cache = cls.__dict__.get("__json_schema_cache__")
+        if cache is None:
+            return _filter_json_schema(cls, super().model_json_schema(*args, **kwargs))
 
-        return result
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            result = cache[key]
+        except KeyError:
+            result = cache[key] = _filter_json_schema(
+                cls, super().model_json_schema(*args, **kwargs)
+            )
+        return deepcopy(result)
 
     @classmethod
     @no_type_check
@@ -322,18 +965,332 @@ class ModelSchema(BaseModel, ModelSchemaMixin[_M], metaclass=ModelSchemaMetaclas
         return cls.from_django(*args, **kwargs)
 
     @classmethod
-    def from_django(cls, objs, many=False, context={}):
+    def optimize_queryset(cls, queryset: QuerySet) -> QuerySet:
+        """
+        Apply the `select_related` and `prefetch_related` lookups required by the
+        nested schemas, so related objects are loaded in O(depth) queries.
+        """
+        select_related, prefetch_related = _get_related_lookups(cls)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    @classmethod
+    def project_queryset(cls, queryset: QuerySet) -> QuerySet:
+        """
+        Restrict the columns loaded by the queryset, including the relations it
+        selects, to the ones read by the schema.
+        """
+        query = queryset.query
+        if (
+            queryset._result_cache is not None
+            or queryset._iterable_class is not ModelIterable
+            or not issubclass(queryset.model, cls.model_config["model"])
+            or query.deferred_loading[0]
+            or query.combinator
+            or query.select_related is True
+        ):
+            return queryset
+
+        only = _get_only_fields(cls, query.select_related or {})
+        if only is None:
+            return queryset
+        return queryset.only(*only)
+
+    @classmethod
+    def _can_use_values(cls, queryset: QuerySet) -> bool:
+        """
+        Flat schemas can read querysets with `values_list()`, skipping the
+        instantiation of Django models.
+        """
+        query = queryset.query
+        return (
+            cls.__values_fields__ is not None
+            and queryset._result_cache is None
+            and queryset._iterable_class is ModelIterable
+            and not queryset._prefetch_related_lookups
+            and issubclass(queryset.model, cls.model_config["model"])
+            # Selecting other columns changes which rows are distinct
+            and not query.distinct
+            and not query.distinct_fields
+            and not query.extra
+        )
+
+    @classmethod
+    def from_django(cls, objs, many=False, context={}, optimize=False):
+        tracker = _query_tracker.get()
+        if tracker is None and not _observers:
+            return cls._from_django(objs, many, context, optimize)
+
+        with ExitStack() as stack:
+            calls = []
+            if tracker is not None:
+                calls.append(stack.enter_context(tracker.track(cls)))
+            if _observers:
+                calls.append(stack.enter_context(observe("from_django", cls)))
+            result = cls._from_django(objs, many, context, optimize)
+            for call in calls:
+                call.rows = len(result) if many else 1
+        return result
+
+    @classmethod
+    def _uses_cache(cls, context: Optional[dict]) -> bool:
+        """
+        Whether to read the cached fragments of the schema. Fragments do not depend
+        on the context, reads with a context bypass the cache.
+        """
+        return cls.__cache_config__ is not None and not context and not is_bypassed()
+
+    @classmethod
+    def _from_django(cls, objs, many, context, optimize):
+        if context and not is_bypassed():
+            with bypass():
+                return cls._from_django(objs, many, context, optimize)
+        if cls._uses_cache(context):
+            return cls._from_django_cached(objs, many, context, optimize)
+
+        if optimize:
+            if isinstance(objs, QuerySet):
+                objs = cls.optimize_queryset(objs)
+            elif not many and _is_model_list(cls, [objs]):
+                prefetch_related_objects([objs], *chain(*_get_related_lookups(cls)))
+
+        if isinstance(objs, QuerySet):
+            if many and cls._can_use_values(objs):
+                keys = cls.__values_fields__
+                if _observers:
+                    data = (dict(zip(keys, row)) for row in objs.values_list(*keys))
+                    return _validate_observed(cls, data, many, context)
+                return [
+                    cls.model_validate(dict(zip(keys, row)), context=context)
+                    for row in objs.values_list(*keys)
+                ]
+            objs = cls.project_queryset(objs)
+            if many:
+                lookups = _get_batch_lookups(cls, objs)
+                if lookups:
+                    objs = objs.prefetch_related(*lookups)
+        elif many:
+            objs = list(objs)
+            if _is_model_list(cls, objs):
+                prefetch_related_objects(objs, *_get_batch_lookups(cls))
+
+        if _observers:
+            data = _read_rows(cls, objs if many else [objs])
+            return _validate_observed(cls, data, many, context)
+
         if many:
-            result_objs = []
-            for obj in objs:
-                obj = ProxyGetterNestedObj(obj, cls)
-                instance = cls(**obj.dict())
-                result_objs.append(cls.model_validate(instance, context=context))
-            return result_objs
+            return [
+                cls.model_validate(_run_read_plan(cls, obj), context=context)
+                for obj in objs
+            ]
+
+        return cls.model_validate(_run_read_plan(cls, objs), context=context)
 
-        obj = ProxyGetterNestedObj(objs, cls)
-        instance = cls(**obj.dict())
-        return cls.model_validate(instance, context=context)
+    @classmethod
+    def _from_django_cached(cls, objs, many, context, optimize):
+        """
+        `from_django` for schemas with `model_config["cache"]`. The relations of
+        nested schemas are only loaded for the objects without a cached fragment.
+        """
+        queryset = None
+        if isinstance(objs, QuerySet):
+            queryset = objs
+            if optimize:
+                select_related, _ = _get_related_lookups(cls)
+                if select_related:
+                    objs = objs.select_related(*select_related)
+            objs = cls.project_queryset(objs)
+
+        instances = list(objs) if many else [objs]
+        if not _is_model_list(cls, instances):
+            lookups = []
+        elif many:
+            lookups = _get_batch_lookups(cls, queryset)
+        elif optimize:
+            lookups = list(chain(*_get_related_lookups(cls)))
+        else:
+            lookups = []
+        result = _read_cached(cls, instances, context, lookups)
+        return result if many else result[0]
+
+    @classmethod
+    async def afrom_django(cls, objs, many=False, context: Optional[dict] = None):
+        """
+        Async version of `from_django`.
+
+        Querysets are read with Django's async ORM, and the relations of nested
+        schemas are always loaded up front so reading them does not query the
+        database from the event loop.
+        """
+        if context and not is_bypassed():
+            with bypass():
+                return await cls.afrom_django(objs, many, context)
+
+        cached = cls._uses_cache(context)
+        if isinstance(objs, QuerySet):
+            queryset = cls.optimize_queryset(objs)
+            if many and not cached and cls._can_use_values(queryset):
+                keys = cls.__values_fields__
+                rows = await _afetch(queryset.values_list(*keys))
+                return [
+                    cls.model_validate(dict(zip(keys, row)), context=context)
+                    for row in rows
+                ]
+            prefetches = _get_pk_list_prefetches(cls, queryset)
+            instances = await _afetch(cls.project_queryset(queryset))
+            await aprefetch_related_objects(instances, *prefetches)
+        else:
+            instances = list(objs) if many else [objs]
+            if _is_model_list(cls, instances):
+                await aprefetch_related_objects(instances, *_get_batch_lookups(cls))
+
+        if cached:
+            # The cache backend is not async
+            result_objs = await sync_to_async(_read_cached)(cls, instances, context)
+            return result_objs if many else result_objs[0]
+
+        def read():
+            return [_run_read_plan(cls, obj) for obj in instances]
+
+        if _reads_unloaded_relations(cls):
+            data = await sync_to_async(read)()
+        else:
+            data = read()
+
+        result_objs = [cls.model_validate(d, context=context) for d in data]
+        return result_objs if many else result_objs[0]
+
+    @classmethod
+    def iter_from_django(
+        cls,
+        queryset: QuerySet,
+        chunk_size=2000,
+        context: Optional[dict] = None,
+        optimize=False,
+    ) -> Iterator["ModelSchema"]:
+        """
+        Yield schema instances for a queryset, fetching and validating the rows
+        one chunk at a time so memory use does not grow with the queryset.
+
+        Prefetched relations are loaded for each chunk, and schemas with
+        `model_config["cache"]` read the cached fragments of each chunk.
+        """
+        if optimize:
+            queryset = cls.optimize_queryset(queryset)
+
+        cached = cls._uses_cache(context)
+        if not cached and cls._can_use_values(queryset):
+            keys = cls.__values_fields__
+            rows = queryset.values_list(*keys).iterator(chunk_size=chunk_size)
+            for row in rows:
+                yield cls.model_validate(dict(zip(keys, row)), context=context)
+            return
+
+        lookups = (
+            *queryset._prefetch_related_lookups,
+            *_get_batch_lookups(cls, queryset),
+        )
+        objs = cls.project_queryset(queryset).prefetch_related(None)
+        objs = objs.iterator(chunk_size=chunk_size)
+        while True:
+            chunk = list(islice(objs, chunk_size))
+            if not chunk:
+                return
+            if cached:
+                yield from _read_cached(cls, chunk, context, lookups)
+                continue
+            if lookups:
+                prefetch_related_objects(chunk, *lookups)
+            # The cache is bypassed per chunk, not across yields to the caller
+            with ExitStack() as stack:
+                if context and not is_bypassed():
+                    stack.enter_context(bypass())
+                rows = [_run_read_plan(cls, obj) for obj in chunk]
+            for row in rows:
+                yield cls.model_validate(row, context=context)
+
+    @classmethod
+    def parallel_export(
+        cls,
+        queryset: QuerySet,
+        workers: Optional[int] = None,
+        chunk_by: str = "pk",
+        chunks: Optional[int] = None,
+        output: Optional[str] = None,
+        context: Optional[dict] = None,
+        optimize=False,
+        executor: Optional[Executor] = None,
+    ) -> List[Any]:
+        """
+        Serialize a queryset in worker processes, each reading a range of
+        `chunk_by` values with its own database connection.
+
+        Args:
+            queryset: The queryset to export, it can be filtered but not sliced.
+            workers: How many processes to start. Defaults to the number of CPUs.
+            chunk_by: The integer field the queryset is split on.
+            chunks: How many ranges to split the queryset in. Defaults to 4 per worker.
+            output: A path template such as `"orders-{shard}.jsonl"`. When given,
+                every range is written to its own newline delimited JSON file.
+            context: The validation context.
+            optimize: Load the relations of nested schemas up front.
+            executor: An executor to use instead of starting a process pool.
+
+        Returns:
+            The schema instances, in the order of the ranges, or the paths of the
+            files written when `output` is given.
+
+        Raises:
+            ValueError: If the schema can not be imported by the workers, the
+                queryset is sliced, or `chunk_by` is not an integer.
+        """
+        return parallel_export(
+            cls,
+            queryset,
+            workers=workers,
+            chunk_by=chunk_by,
+            chunks=chunks,
+            output=output,
+            context=context,
+            optimize=optimize,
+            executor=executor,
+        )
 
 
 _is_base_model_class_defined = True
+
+
+def generate_json_schemas(
+    schemas: Sequence[Type[ModelSchema]],
+    mode: JsonSchemaMode = "validation",
+    by_alias: bool = True,
+    ref_template: str = DEFAULT_REF_TEMPLATE,
+    schema_generator: Type[GenerateJsonSchema] = GenerateJsonSchema,
+) -> Tuple[Dict[Type[ModelSchema], Dict[str, Any]], Dict[str, Any]]:
+    """
+    Generate the JSON schemas of several model schemas at once, e.g. for an OpenAPI
+    document. Returns a `$ref` per schema and the definitions they share:
+
+        refs, definitions = generate_json_schemas([UserSchema, ProfileSchema])
+        refs[UserSchema]  # {"$ref": "#/$defs/UserSchema"}
+        definitions["$defs"]["UserSchema"]  # {"properties": ...}
+    """
+    json_schemas, definitions = models_json_schema(
+        [(schema, mode) for schema in schemas],
+        by_alias=by_alias,
+        ref_template=ref_template,
+        schema_generator=schema_generator,
+    )
+    defs = definitions.get("$defs", {})
+    refs = {ref_template.format(model=name): name for name in defs}
+
+    result = {}
+    for schema in schemas:
+        json_schema = json_schemas[(schema, mode)]
+        ref = json_schema.get("$ref")
+        _filter_json_schema(schema, defs[refs[ref]] if ref in refs else json_schema)
+        result[schema] = json_schema
+    return result, definitions
@@ -1,11 +1,110 @@
-from typing import Any, Generic, Optional, TypeVar, Union
+import logging
+import time
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import django
+from django.core.exceptions import FieldDoesNotExist
+from django.db import router
 from django.db.models import Model as DjangoModel
 
+from .cache import invalidate
+from .instrumentation import _observers, observe, observed
+
+logger = logging.getLogger("djantic")
+
 _M = TypeVar("_M", bound=DjangoModel)
 
 
+def _get_current_value(instance: DjangoModel, key: str) -> Any:
+    try:
+        field = instance._meta.get_field(key)
+    except FieldDoesNotExist:
+        return getattr(instance, key)
+    if field.concrete and not field.many_to_many:
+        # Read foreign keys from their column rather than loading the related row
+        return field.value_from_object(instance)
+    return getattr(instance, key)
+
+
+def _set_values(
+    instance: DjangoModel, data: dict, partial: Optional[bool]
+) -> List[str]:
+    """
+    Assign the data to the instance and return the changed attributes. Partial
+    updates skip the values that are already set.
+    """
+    changed = []
+    for key, value in data.items():
+        if not hasattr(instance, key):
+            raise ValueError(f"Field {key} does not exist on the model.")
+        if partial and _get_current_value(instance, key) == value:
+            continue
+        setattr(instance, key, value)
+        changed.append(key)
+    return changed
+
+
+def _get_update_fields(
+    instance: DjangoModel, changed: Sequence[str]
+) -> Optional[List[str]]:
+    """
+    The `update_fields` for saving the changed attributes, or None when one of
+    them is not a concrete field and the whole row has to be saved.
+    """
+    update_fields = []
+    for key in changed:
+        try:
+            field = instance._meta.get_field(key)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        update_fields.append(field.name)
+
+    # Keep auto_now timestamps such as `updated_at` in step with the change
+    for field in instance._meta.concrete_fields:
+        if getattr(field, "auto_now", False) and field.name not in update_fields:
+            update_fields.append(field.name)
+    return update_fields
+
+
+def _get_conflict_update_fields(
+    model: type, names: Iterable[str], unique_fields: Sequence[str]
+) -> List[str]:
+    """
+    The fields `bulk_create` updates on conflict by default: the concrete fields
+    of the schema, except the primary key and `unique_fields`.
+    """
+    update_fields = []
+    for name in names:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if (
+            not field.concrete
+            or field.many_to_many
+            or field.primary_key
+            or name in unique_fields
+        ):
+            continue
+        update_fields.append(field.name)
+    return update_fields
+
+
 class ModelSchemaMixin(Generic[_M]):
+    @observed("create")
     def create(self, *args: Any, **kwargs: Any) -> _M:
         ModelDjangoClass: type[_M] = self.model_config["model"]
 
@@ -13,6 +112,154 @@ class ModelSchemaMixin(Generic[_M]):
 
         return record
 
+    @classmethod
+    @observed("bulk_save")
+    def bulk_save(
+        cls,
+        instances: Iterable["ModelSchemaMixin[_M]"],
+        batch_size: Optional[int] = None,
+        ignore_conflicts: bool = False,
+        update_conflicts: bool = False,
+        update_fields: Optional[Sequence[str]] = None,
+        unique_fields: Optional[Sequence[str]] = None,
+    ) -> List[_M]:
+        """Create the model instances for many schema instances with `bulk_create`.
+
+        Args:
+            instances: The schema instances to save.
+            batch_size: How many records are inserted per query. All of them when None.
+            ignore_conflicts: Ignore rows that fail a unique constraint.
+            update_conflicts: Update rows that fail a unique constraint instead.
+            update_fields: The fields to update on conflict. Defaults to the concrete
+                fields of the schema, except the primary key and `unique_fields`.
+            unique_fields: The fields that identify a conflict.
+
+        Returns:
+            The created model instances. The time spent on each batch is logged,
+            and reported to the observers as a `bulk_save_batch` event.
+
+        Raises:
+            ValueError: If `update_conflicts` is used with Django < 4.1.
+        """
+        ModelDjangoClass: type[_M] = cls.model_config["model"]  # type: ignore
+        records = [ModelDjangoClass(**obj.model_dump()) for obj in instances]
+
+        kwargs: dict = {"ignore_conflicts": ignore_conflicts}
+        if update_conflicts:
+            if django.VERSION < (4, 1):
+                raise ValueError("update_conflicts requires Django 4.1 or later.")
+            if update_fields is None:
+                update_fields = _get_conflict_update_fields(
+                    ModelDjangoClass,
+                    cls.model_fields,  # type: ignore
+                    unique_fields or (),
+                )
+            kwargs.update(
+                update_conflicts=True,
+                update_fields=update_fields,
+                unique_fields=unique_fields,
+            )
+
+        batch_size = batch_size or len(records) or 1
+        created: List[_M] = []
+        for start in range(0, len(records), batch_size):
+            batch = records[start : start + batch_size]
+            started = time.perf_counter()
+            if _observers:
+                with observe("bulk_save_batch", cls, rows=len(batch)):
+                    saved = ModelDjangoClass._default_manager.bulk_create(
+                        batch, **kwargs
+                    )
+            else:
+                saved = ModelDjangoClass._default_manager.bulk_create(batch, **kwargs)
+            created.extend(saved)
+            logger.debug(
+                "%s.bulk_save: saved %d %s records in %.4fs",
+                cls.__name__,
+                len(batch),
+                ModelDjangoClass.__name__,
+                time.perf_counter() - started,
+            )
+
+        # bulk_create does not send the signals invalidating cached fragments
+        invalidate(
+            ModelDjangoClass,
+            [record.pk for record in created],
+            router.db_for_write(ModelDjangoClass),
+        )
+        return created
+
+    @classmethod
+    @observed("bulk_update")
+    def bulk_update(
+        cls,
+        pairs: Iterable[Tuple[_M, "ModelSchemaMixin[_M]"]],
+        partial: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> List[_M]:
+        """Apply many schema instances to their model instances with `bulk_update`.
+
+        The instances are grouped by the fields that changed, and each group is
+        updated with the smallest field list, in batches of `batch_size`.
+
+        Args:
+            pairs: `(instance, schema)` pairs, the schema data is written to the
+                instance.
+            partial: If True, only fields that have been explicitly set are updated.
+            batch_size: How many records are updated per query. All of them when None.
+
+        Returns:
+            The updated model instances. Instances without changes are not included.
+
+        Raises:
+            ValueError: If a field does not exist on the model, or is not a concrete
+                field that `bulk_update` can write.
+        """
+        ModelDjangoClass: type[_M] = cls.model_config["model"]  # type: ignore
+        groups: Dict[Tuple[str, ...], List[_M]] = {}
+
+        for instance, schema in pairs:
+            if not isinstance(instance, ModelDjangoClass):
+                raise TypeError(
+                    "instance is not of the type {0}".format(ModelDjangoClass)  # noqa
+                )
+
+            data = schema.model_dump(exclude_unset=partial)  # type: ignore
+            changed = _set_values(instance, data, partial)
+            if not changed:
+                continue
+
+            update_fields = _get_update_fields(instance, changed)
+            if update_fields is None:
+                raise ValueError(
+                    f"Fields {changed} can not all be updated with bulk_update."
+                )
+            for name in update_fields:
+                field = instance._meta.get_field(name)
+                if getattr(field, "auto_now", False):
+                    # bulk_update does not call pre_save, set the timestamp here
+                    field.pre_save(instance, add=False)
+
+            groups.setdefault(tuple(sorted(update_fields)), []).append(instance)
+
+        # bulk_update does not send the signals invalidating cached fragments
+        using = router.db_for_write(ModelDjangoClass)
+        updated: List[_M] = []
+        for fields, instances in groups.items():
+            pks = [instance.pk for instance in instances]
+            if any(
+                ModelDjangoClass._meta.get_field(name).is_relation for name in fields
+            ):
+                # The objects related to the instances before they change
+                invalidate(ModelDjangoClass, pks, using)
+            ModelDjangoClass._default_manager.bulk_update(
+                instances, fields, batch_size=batch_size
+            )
+            invalidate(ModelDjangoClass, pks, using)
+            updated.extend(instances)
+        return updated
+
+    @observed("update")
     def update(
         self, instance: _M, partial: Optional[bool] = None, *args: Any, **kwargs: Any
     ) -> _M:
@@ -25,15 +272,19 @@ class ModelSchemaMixin(Generic[_M]):
 
         if instance:
             # Update the existing instance with the new data
-            for key, value in data.items():
-                if hasattr(instance, key):
-                    setattr(instance, key, value)
-                else:
-                    raise ValueError(f"Field {key} does not exist on the model.")
+            changed = _set_values(instance, data, partial)
+
+            if partial and not instance._state.adding and "update_fields" not in kwargs:
+                if not changed:
+                    return instance
+                update_fields = _get_update_fields(instance, changed)
+                if update_fields is not None:
+                    kwargs["update_fields"] = update_fields
             instance.save(*args, **kwargs)
 
             return instance
 
+    @observed("save")
     def save(
         self,
         instance: Optional[_M] = None,
@@ -63,7 +314,7 @@ class ModelSchemaMixin(Generic[_M]):
         """
 
         if instance:
-            record = self.update(instance, partial, *args, *kwargs)
+            record = self.update(instance, partial, *args, **kwargs)
             assert record is not None, "`update()` did not return an object instance."
         else:
             record = self.create(*args, **kwargs)
@@ -0,0 +1,56 @@
+from itertools import islice
+from typing import Any, Iterator, Type
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+
+from .main import ModelSchema
+
+
+def _iter_json_chunks(
+    schema_class: Type[ModelSchema], queryset: QuerySet, ndjson: bool, chunk_size: int
+) -> Iterator[str]:
+    instances = schema_class.iter_from_django(queryset, chunk_size=chunk_size)
+    separator = "\n" if ndjson else ","
+    first = True
+
+    if not ndjson:
+        yield "["
+
+    while True:
+        chunk = [obj.model_dump_json() for obj in islice(instances, chunk_size)]
+        if not chunk:
+            break
+
+        content = separator.join(chunk)
+        if ndjson:
+            content += "\n"
+        elif not first:
+            content = separator + content
+        first = False
+        yield content
+
+    if not ndjson:
+        yield "]"
+
+
+def stream_from_django(
+    schema_class: Type[ModelSchema],
+    queryset: QuerySet,
+    ndjson: bool = False,
+    chunk_size: int = 2000,
+    **kwargs: Any,
+) -> StreamingHttpResponse:
+    """
+    Return a response that streams a queryset serialized with the schema, either
+    as a JSON array or as newline delimited JSON.
+
+    The rows are read and dumped one chunk at a time, so the first bytes are sent
+    before the whole queryset has been serialized.
+    """
+    kwargs.setdefault(
+        "content_type", "application/x-ndjson" if ndjson else "application/json"
+    )
+    return StreamingHttpResponse(
+        _iter_json_chunks(schema_class, queryset, ndjson, chunk_size), **kwargs
+    )
@@ -0,0 +1,394 @@
+from typing import List
+from unittest.mock import patch
+
+import django
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from pydantic import AliasGenerator, ConfigDict, ValidationInfo, field_validator
+from pydantic.alias_generators import to_camel
+from pydantic.errors import PydanticUserError
+from testapp.models import (
+    Article,
+    Message,
+    Preference,
+    Profile,
+    Publication,
+    Thread,
+    User,
+)
+
+import djantic.cache
+from djantic import ModelSchema
+from djantic.cache import get_cache_key, get_dependencies
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    schemas = set(djantic.cache._cached_schemas)
+    cache.clear()
+    yield
+    cache.clear()
+    # Stop invalidating the fragments of the schemas defined by the test
+    for schema in set(djantic.cache._cached_schemas) - schemas:
+        djantic.cache._cached_schemas.discard(schema)
+    djantic.cache._dependents = None
+
+
+@pytest.mark.django_db
+def test_cached_fragments(django_assert_num_queries):
+    user = User.objects.create(first_name="Jordan", email="jordan@eremieff.com")
+
+    class UserSchema(ModelSchema):
+        model_config = ConfigDict(model=User, include=["id", "first_name"], cache=True)
+
+    assert UserSchema.__cache_config__.version_field == "updated_at"
+    assert UserSchema.from_django(user) == {"id": 1, "first_name": "Jordan"}
+
+    # The fragment is reused while updated_at does not change
+    User.objects.update(first_name="Sara")
+    with django_assert_num_queries(1):
+        assert UserSchema.from_django(User.objects.all(), many=True) == [
+            {"id": 1, "first_name": "Jordan"}
+        ]
+
+    user.refresh_from_db()
+    user.save()
+    assert UserSchema.from_django(user) == {"id": 1, "first_name": "Sara"}
+
+
+@pytest.mark.django_db
+def test_cached_fragments_are_not_validated_again():
+    user = User.objects.create(first_name="Jordan", email="jordan@eremieff.com")
+    calls = []
+
+    class UserSchema(ModelSchema):
+        model_config = ConfigDict(
+            model=User,
+            include=["id", "first_name"],
+            alias_generator=AliasGenerator(serialization_alias=to_camel),
+            cache=True,
+        )
+
+        @field_validator("first_name", check_fields=False)
+        @classmethod
+        def greet(cls, v):
+            calls.append(v)
+            return f"Hi {v}"
+
+    assert UserSchema.from_django(user).first_name == "Hi Jordan"
+    assert UserSchema.from_django(user).first_name == "Hi Jordan"
+    assert calls == ["Jordan"]
+    assert UserSchema.from_django(user).model_dump(by_alias=True) == {
+        "id": 1,
+        "firstName": "Hi Jordan",
+    }
+
+
+@pytest.mark.django_db
+def test_context_bypasses_the_cache():
+    user = User.objects.create(first_name="Jordan", email="jordan@eremieff.com")
+
+    class UserSchema(ModelSchema):
+        model_config = ConfigDict(model=User, include=["id", "first_name"], cache=True)
+
+        @field_validator("first_name", check_fields=False)
+        @classmethod
+        def add_prefix(cls, v, info: ValidationInfo):
+            return f"{(info.context or {}).get('prefix', '')}{v}"
+
+    class ProfileSchema(ModelSchema):
+        user: UserSchema
+        model_config = ConfigDict(model=Profile, include=["id", "user"])
+
+    profile = Profile.objects.create(user=user, website="", location="")
+
+    assert UserSchema.from_django(user).first_name == "Jordan"
+    assert is_cached(UserSchema, user.pk)
+    for prefix in ("Mr ", "Dr "):
+        context = {"prefix": prefix}
+        assert UserSchema.from_django(user, context=context).first_name == (
+            f"{prefix}Jordan"
+        )
+        assert ProfileSchema.from_django(profile, context=context).user.first_name == (
+            f"{prefix}Jordan"
+        )
+        assert [
+            u.first_name
+            for u in UserSchema.iter_from_django(User.objects.all(), context=context)
+        ] == [f"{prefix}Jordan"]
+        assert async_to_sync(UserSchema.afrom_django)(
+            user, context=context
+        ).first_name == (f"{prefix}Jordan")
+    assert UserSchema.from_django(user).first_name == "Jordan"
+
+
+@pytest.mark.django_db
+def test_all_entry_points_use_the_cache(django_assert_num_queries):
+    user = User.objects.create(first_name="Jordan", email="jordan@eremieff.com")
+
+    class UserSchema(ModelSchema):
+        model_config = ConfigDict(model=User, include=["id", "first_name"], cache=True)
+
+    UserSchema.from_django(user)
+    User.objects.update(first_name="Sara")
+    expected = [{"id": 1, "first_name": "Jordan"}]
+
+    with django_assert_num_queries(1):
+        assert list(UserSchema.iter_from_django(User.objects.all())) == expected
+    assert (
+        async_to_sync(UserSchema.afrom_django)(User.objects.all(), many=True)
+        == expected
+    )
+
+
+@pytest.mark.django_db
+def test_cached_fragments_keep_enums():
+    preference = Preference.objects.create(name="Jordan")
+
+    class PreferenceSchema(ModelSchema):
+        model_config = ConfigDict(
+            model=Preference, include=["id", "preferred_food"], cache=True
+        )
+
+    expected = PreferenceSchema.from_django(preference)
+    cached = PreferenceSchema.from_django(preference)
+    assert cached == expected
+    assert type(cached.preferred_food) is type(expected.preferred_food)
+
+
+def test_cache_key_changes_with_the_schema_definition():
+    class UserSchema(ModelSchema):
+        first_name: str
+        model_config = ConfigDict(model=User, include=["id", "first_name"], cache=True)
+
+    prefix = UserSchema.__cache_config__.prefix
+
+    class UserSchema(ModelSchema):
+        first_name: int
+        model_config = ConfigDict(model=User, include=["id", "first_name"], cache=True)
+
+    assert UserSchema.__cache_config__.prefix != prefix
+    prefix = UserSchema.__cache_config__.prefix
+
+    class UserSchema(ModelSchema):
+        first_name: int
+        model_config = ConfigDict(model=User, include=["id", "first_name"], cache=True)
+
+        @field_validator("first_name", check_fields=False)
+        @classmethod
+        def double(cls, v):
+            return v * 2
+
+    assert UserSchema.__cache_config__.prefix != prefix
+
+
+@pytest.mark.django_db
+def test_nested_fragments_are_reused(django_assert_num_queries):
+    for i in range(2):
+        thread = Thread.objects.create(title=f"Thread {i}")
+        for j in range(2):
+            Message.objects.create(content=f"Message {i}.{j}", thread=thread)
+
+    class MessageSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["id", "content"], cache=True)
+
+    class ThreadSchema(ModelSchema):
+        messages: List[MessageSchema]
+        model_config = ConfigDict(
+            model=Thread, include=["id", "title", "messages"], cache=True
+        )
+
+    expected = ThreadSchema.from_django(Thread.objects.all(), many=True)
+
+    # Cached threads do not load their messages
+    with django_assert_num_queries(1):
+        assert ThreadSchema.from_django(Thread.objects.all(), many=True) == expected
+
+    # A thread read again reuses the fragments of its messages
+    Message.objects.update(content="Changed")
+    cache.delete(get_cache_key(ThreadSchema.__cache_config__, 1))
+    with django_assert_num_queries(2):
+        assert ThreadSchema.from_django(Thread.objects.all(), many=True) == expected
+
+
+class CachedMessageSchema(ModelSchema):
+    model_config = ConfigDict(model=Message, include=["id", "content"], cache=True)
+
+
+class CachedThreadSchema(ModelSchema):
+    messages: List[CachedMessageSchema]
+    model_config = ConfigDict(
+        model=Thread, include=["id", "title", "messages"], cache=True
+    )
+
+
+def is_cached(schema_class, pk):
+    return cache.get(get_cache_key(schema_class.__cache_config__, pk)) is not None
+
+
+def test_get_dependencies():
+    assert get_dependencies(CachedThreadSchema) == [
+        (Thread, ""),
+        (Message, "messages"),
+    ]
+
+
+@pytest.mark.django_db
+def test_changes_invalidate_cached_fragments():
+    threads = [Thread.objects.create(title=f"Thread {i}") for i in range(2)]
+    message = Message.objects.create(content="First", thread=threads[0])
+    CachedThreadSchema.from_django(Thread.objects.all(), many=True)
+    assert is_cached(CachedThreadSchema, threads[0].pk)
+    assert is_cached(CachedMessageSchema, message.pk)
+
+    # A new message invalidates its thread
+    Message.objects.create(content="Second", thread=threads[0])
+    assert not is_cached(CachedThreadSchema, threads[0].pk)
+    assert is_cached(CachedThreadSchema, threads[1].pk)
+    assert is_cached(CachedMessageSchema, message.pk)
+    assert len(CachedThreadSchema.from_django(threads[0]).messages) == 2
+
+    # Moving a message invalidates both threads
+    CachedThreadSchema.from_django(Thread.objects.all(), many=True)
+    message.thread = threads[1]
+    message.save()
+    assert not is_cached(CachedMessageSchema, message.pk)
+    assert not is_cached(CachedThreadSchema, threads[0].pk)
+    assert not is_cached(CachedThreadSchema, threads[1].pk)
+
+    CachedThreadSchema.from_django(Thread.objects.all(), many=True)
+    message.delete()
+    assert not is_cached(CachedThreadSchema, threads[1].pk)
+    assert is_cached(CachedThreadSchema, threads[0].pk)
+
+
+@pytest.mark.django_db
+def test_save_reads_related_objects_once():
+    thread = Thread.objects.create(title="Thread")
+    message = Message.objects.create(content="First", thread=thread)
+    CachedThreadSchema.from_django(thread)
+
+    # The related objects are only looked up before the save when a foreign key
+    # changes, otherwise post_save finds the same ones
+    message.content = "Changed"
+    with CaptureQueriesContext(connection) as queries:
+        message.save(update_fields=["content"])
+    assert queries[0]["sql"].startswith("UPDATE")
+    assert not is_cached(CachedThreadSchema, thread.pk)
+
+    CachedThreadSchema.from_django(thread)
+    with CaptureQueriesContext(connection) as queries:
+        message.save()
+    assert queries[0]["sql"].startswith('SELECT "testapp_message"."thread_id"')
+    assert queries[1]["sql"].startswith("UPDATE")
+    assert not is_cached(CachedThreadSchema, thread.pk)
+
+
+@pytest.mark.django_db
+def test_bulk_update_invalidates_cached_fragments():
+    threads = [Thread.objects.create(title=f"Thread {i}") for i in range(2)]
+    message = Message.objects.create(content="First", thread=threads[0])
+    CachedThreadSchema.from_django(Thread.objects.all(), many=True)
+
+    class MessageSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["content"])
+
+    MessageSchema.bulk_update([(message, MessageSchema(content="Changed"))])
+    assert not is_cached(CachedMessageSchema, message.pk)
+    assert not is_cached(CachedThreadSchema, threads[0].pk)
+    assert is_cached(CachedThreadSchema, threads[1].pk)
+    assert CachedThreadSchema.from_django(threads[0]).messages[0].content == "Changed"
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(django.VERSION < (4, 1), reason="Requires Django 4.1")
+def test_bulk_save_invalidates_cached_fragments():
+    user = User.objects.create(first_name="Jordan", email="jordan@eremieff.com")
+
+    class UserSchema(ModelSchema):
+        model_config = ConfigDict(
+            model=User, include=["id", "first_name", "email"], cache=True
+        )
+
+    UserSchema.from_django(user)
+    UserSchema.bulk_save(
+        [UserSchema(first_name="Sara", email="jordan@eremieff.com")],
+        update_conflicts=True,
+        unique_fields=["email"],
+    )
+    assert UserSchema.from_django(User.objects.get()).first_name == "Sara"
+
+
+@pytest.mark.django_db
+def test_related_objects_are_invalidated_in_batches(monkeypatch):
+    monkeypatch.setattr(djantic.cache, "INVALIDATE_BATCH_SIZE", 2)
+    thread = Thread.objects.create(title="Thread")
+    messages = [
+        Message.objects.create(content=f"Message {i}", thread=thread) for i in range(5)
+    ]
+
+    class ThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["id", "title"])
+
+    class MessageSchema(ModelSchema):
+        thread: ThreadSchema
+        model_config = ConfigDict(
+            model=Message, include=["id", "content", "thread"], cache=True
+        )
+
+    MessageSchema.from_django(Message.objects.all(), many=True)
+    assert all(is_cached(MessageSchema, message.pk) for message in messages)
+
+    with patch.object(cache, "delete_many", wraps=cache.delete_many) as delete_many:
+        thread.save()
+    assert not any(is_cached(MessageSchema, message.pk) for message in messages)
+    prefix = MessageSchema.__cache_config__.prefix
+    assert [
+        len(call.args[0])
+        for call in delete_many.call_args_list
+        if call.args[0][0].startswith(prefix)
+    ] == [2, 2, 1]
+
+
+@pytest.mark.django_db
+def test_m2m_changes_invalidate_cached_fragments():
+    class ArticleSchema(ModelSchema):
+        model_config = ConfigDict(
+            model=Article, include=["id", "publications"], cache=True
+        )
+
+    class PublicationSchema(ModelSchema):
+        model_config = ConfigDict(
+            model=Publication, include=["id", "article_set"], cache=True
+        )
+
+    publication = Publication.objects.create(title="Django")
+    article = Article.objects.create(headline="Djantic", pub_date="2021-01-01")
+
+    def read():
+        ArticleSchema.from_django(article)
+        PublicationSchema.from_django(publication)
+
+    read()
+    article.publications.add(publication)
+    assert not is_cached(ArticleSchema, article.pk)
+    assert not is_cached(PublicationSchema, publication.pk)
+
+    read()
+    assert PublicationSchema.from_django(publication).article_set == [{"id": 1}]
+    article.publications.clear()
+    assert not is_cached(ArticleSchema, article.pk)
+    assert not is_cached(PublicationSchema, publication.pk)
+    assert PublicationSchema.from_django(publication).article_set == []
+
+
+def test_cache_version_field_must_exist():
+    with pytest.raises(PydanticUserError, match="not a field of Thread"):
+
+        class ThreadSchema(ModelSchema):
+            model_config = ConfigDict(
+                model=Thread, cache={"version_field": "updated_at"}
+            )
@@ -0,0 +1,85 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+from pydantic import ConfigDict
+from testapp.models import Message, Thread
+
+from djantic import ModelSchema
+from djantic.export import _get_ranges
+
+
+class ThreadSchema(ModelSchema):
+    model_config = ConfigDict(model=Thread, include=["id", "title"])
+
+
+class MessageSchema(ModelSchema):
+    model_config = ConfigDict(model=Message, include=["id", "content"])
+
+
+class ThreadWithMessagesSchema(ModelSchema):
+    messages: List[MessageSchema]
+    model_config = ConfigDict(model=Thread, include=["id", "title", "messages"])
+
+
+def test_get_ranges():
+    assert _get_ranges(1, 10, 3) == [(1, 5), (5, 9), (9, 11)]
+    assert _get_ranges(5, 5, 4) == [(5, 6)]
+    assert _get_ranges(1, 3, 8) == [(1, 2), (2, 3), (3, 4)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_export(tmp_path):
+    for i in range(10):
+        Thread.objects.create(title=f"Thread {i}")
+    queryset = Thread.objects.filter(id__gt=2).order_by("id")
+    expected = ThreadSchema.from_django(queryset, many=True)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = ThreadSchema.parallel_export(
+            queryset, workers=2, chunks=3, executor=executor
+        )
+        assert result == expected
+
+        paths = ThreadSchema.parallel_export(
+            queryset,
+            workers=2,
+            chunks=3,
+            output=str(tmp_path / "threads-{shard}.jsonl"),
+            executor=executor,
+        )
+
+    assert paths == [str(tmp_path / f"threads-{shard}.jsonl") for shard in range(3)]
+    lines = [line for path in paths for line in open(path).read().splitlines()]
+    assert [json.loads(line) for line in lines] == [t.model_dump() for t in expected]
+
+    assert ThreadSchema.parallel_export(Thread.objects.none(), workers=2) == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_export_in_processes():
+    thread = Thread.objects.create(title="My thread")
+    for i in range(3):
+        Thread.objects.create(title=f"Thread {i}")
+    Message.objects.create(content="First", thread=thread)
+    queryset = Thread.objects.prefetch_related("messages").order_by("id")
+
+    assert ThreadWithMessagesSchema.parallel_export(
+        queryset, workers=2, chunks=2
+    ) == ThreadWithMessagesSchema.from_django(queryset, many=True)
+
+
+@pytest.mark.django_db
+def test_parallel_export_errors():
+    class LocalThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["id", "title"])
+
+    with pytest.raises(ValueError, match="top level of a module"):
+        LocalThreadSchema.parallel_export(Thread.objects.all(), workers=2)
+
+    with pytest.raises(ValueError, match="sliced"):
+        ThreadSchema.parallel_export(Thread.objects.all()[:10], workers=2)
+
+    with pytest.raises(ValueError, match="values"):
+        ThreadSchema.parallel_export(Thread.objects.values("id"), workers=2)
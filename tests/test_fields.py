@@ -1,8 +1,11 @@
-from typing import Optional
+from typing import List, Optional
 
 import pytest
+from django.db import models
 from pydantic import ConfigDict, ValidationError, ValidationInfo, field_validator
+from testapp.fields import ListField
 from testapp.models import (
+    Case,
     Configuration,
     Listing,
     NullableChar,
@@ -13,7 +16,8 @@ from testapp.models import (
     User,
 )
 
-from djantic import ModelSchema
+from djantic import ModelSchema, fields, register_field_type
+from djantic.fields import get_internal_type
 
 
 @pytest.mark.django_db
@@ -235,27 +239,27 @@ def test_lazy_choice_field():
 
     assert RecordSchema.model_json_schema() == {
         "$defs": {
-            "RecordSchemaRecordStatusEnum": {
+            "RecordRecordStatusEnum": {
                 "enum": [0, 1, 2],
-                "title": "RecordSchemaRecordStatusEnum",
+                "title": "RecordRecordStatusEnum",
                 "type": "integer",
             },
-            "RecordSchemaRecordTypeEnum": {
+            "RecordRecordTypeEnum": {
                 "enum": ["NEW", "OLD"],
-                "title": "RecordSchemaRecordTypeEnum",
+                "title": "RecordRecordTypeEnum",
                 "type": "string",
             },
         },
         "description": "A generic record model.",
         "properties": {
             "record_type": {
-                "$ref": "#/$defs/RecordSchemaRecordTypeEnum",
+                "$ref": "#/$defs/RecordRecordTypeEnum",
                 "default": "NEW",
                 "description": "record_type",
                 "title": "Record Type",
             },
             "record_status": {
-                "$ref": "#/$defs/RecordSchemaRecordStatusEnum",
+                "$ref": "#/$defs/RecordRecordStatusEnum",
                 "default": 0,
                 "description": "record_status",
                 "title": "Record Status",
@@ -273,24 +277,24 @@ def test_enum_choices():
 
     assert PreferenceSchema.model_json_schema() == {
         "$defs": {
-            "PreferenceSchemaPreferredFoodEnum": {
+            "PreferencePreferredFoodEnum": {
                 "enum": ["ba", "ap"],
-                "title": "PreferenceSchemaPreferredFoodEnum",
+                "title": "PreferencePreferredFoodEnum",
                 "type": "string",
             },
-            "PreferenceSchemaPreferredGroupEnum": {
+            "PreferencePreferredGroupEnum": {
                 "enum": [1, 2],
-                "title": "PreferenceSchemaPreferredGroupEnum",
+                "title": "PreferencePreferredGroupEnum",
                 "type": "integer",
             },
-            "PreferenceSchemaPreferredMusicianEnum": {
+            "PreferencePreferredMusicianEnum": {
                 "enum": ["tom_jobim", "sinatra", ""],
-                "title": "PreferenceSchemaPreferredMusicianEnum",
+                "title": "PreferencePreferredMusicianEnum",
                 "type": "string",
             },
-            "PreferenceSchemaPreferredSportEnum": {
+            "PreferencePreferredSportEnum": {
                 "enum": ["football", "basketball", ""],
-                "title": "PreferenceSchemaPreferredSportEnum",
+                "title": "PreferencePreferredSportEnum",
                 "type": "string",
             },
         },
@@ -309,20 +313,20 @@ def test_enum_choices():
                 "type": "string",
             },
             "preferred_food": {
-                "$ref": "#/$defs/PreferenceSchemaPreferredFoodEnum",
+                "$ref": "#/$defs/PreferencePreferredFoodEnum",
                 "default": "ba",
                 "description": "preferred_food",
                 "title": "Preferred Food",
             },
             "preferred_group": {
-                "$ref": "#/$defs/PreferenceSchemaPreferredGroupEnum",
+                "$ref": "#/$defs/PreferencePreferredGroupEnum",
                 "default": 1,
                 "description": "preferred_group",
                 "title": "Preferred Group",
             },
             "preferred_sport": {
                 "anyOf": [
-                    {"$ref": "#/$defs/PreferenceSchemaPreferredSportEnum"},
+                    {"$ref": "#/$defs/PreferencePreferredSportEnum"},
                     {"type": "null"},
                 ],
                 "default": None,
@@ -331,7 +335,7 @@ def test_enum_choices():
             },
             "preferred_musician": {
                 "anyOf": [
-                    {"$ref": "#/$defs/PreferenceSchemaPreferredMusicianEnum"},
+                    {"$ref": "#/$defs/PreferencePreferredMusicianEnum"},
                     {"type": "null"},
                 ],
                 "default": "",
@@ -361,19 +365,31 @@ def test_enum_choices():
     }
 
 
-@pytest.mark.skip(reason="Enums seems unique, but need other approach to verify")
 @pytest.mark.django_db
-def test_enum_choices_generates_unique_enums():
+def test_enum_choices_are_shared_between_schemas():
     class PreferenceSchema(ModelSchema):
         model_config = ConfigDict(model=Preference, use_enum_values=True)
 
     class PreferenceSchema2(ModelSchema):
-        model_config = ConfigDict(model=Preference, use_enum_values=True)
+        model_config = ConfigDict(
+            model=Preference, include=["name", "preferred_food"], use_enum_values=True
+        )
 
-    assert str(PreferenceSchema2.model_fields["preferred_food"].type_) != str(
-        PreferenceSchema.model_fields["preferred_food"].type_
+    assert (
+        PreferenceSchema2.model_fields["preferred_food"].annotation
+        is PreferenceSchema.model_fields["preferred_food"].annotation
     )
 
+    class PreferenceListSchema(ModelSchema):
+        items: List[PreferenceSchema]
+        other: PreferenceSchema2
+        model_config = ConfigDict(model=Preference, include=["items", "other"])
+
+    defs = PreferenceListSchema.model_json_schema()["$defs"]
+    assert [name for name in defs if "PreferredFood" in name] == [
+        "PreferencePreferredFoodEnum"
+    ]
+
 
 @pytest.mark.django_db
 def test_listing():
@@ -439,3 +455,53 @@ def test_nullable_fk():
 
     model2 = NullableFK(nullable_char=None)
     assert NullableFKSchema.from_django(model2).dict() == {"nullable_char": None}
+
+
+@pytest.mark.django_db
+def test_field_conversion_is_cached(monkeypatch):
+    class CaseSchema(ModelSchema):
+        model_config = ConfigDict(model=Case)
+
+    def fail():
+        raise AssertionError("field should not be converted again")
+
+    for field in Case._meta.get_fields():
+        monkeypatch.setattr(field, "deconstruct", fail, raising=False)
+
+    class CaseListSchema(ModelSchema):
+        model_config = ConfigDict(model=Case, include=["id", "name"])
+
+    assert CaseListSchema.model_json_schema()["properties"]["name"] == (
+        CaseSchema.model_json_schema()["properties"]["name"]
+    )
+
+
+class StrictCharField(models.CharField):
+    def __init__(self, required, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def get_internal_type(self):
+        return "StrictCharField"
+
+
+def test_internal_type_without_instantiating_field_classes():
+    field = StrictCharField("required", max_length=10)
+    assert get_internal_type(field) is str
+
+
+@pytest.mark.django_db
+def test_register_field_type(monkeypatch):
+    monkeypatch.setattr(fields, "_registered_field_types", {})
+    monkeypatch.setattr(fields, "_internal_type_cache", {})
+    monkeypatch.setattr(fields, "_field_cache", {})
+    register_field_type(ListField, List[str])
+
+    class RecordSchema(ModelSchema):
+        model_config = ConfigDict(model=Record, include=["items"])
+
+    assert RecordSchema.model_json_schema()["properties"]["items"] == {
+        "description": "items",
+        "items": {"type": "string"},
+        "title": "Items",
+        "type": "array",
+    }
@@ -0,0 +1,159 @@
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from pydantic import ConfigDict, Field
+from testapp.models import Message, Thread
+
+from djantic import (
+    HistogramObserver,
+    ModelSchema,
+    Observer,
+    add_observer,
+    remove_observer,
+    track_queries,
+)
+from djantic.instrumentation import SchemaQueries, _suggest_lookup, logger
+
+
+@pytest.fixture
+def threads():
+    for title in ("First", "Second", "Third"):
+        thread = Thread.objects.create(title=title)
+        for content in ("Hello", "World"):
+            Message.objects.create(content=content, thread=thread)
+
+
+@pytest.mark.django_db
+def test_track_queries(threads):
+    class MessageSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["id", "content"])
+
+    class ThreadSchema(ModelSchema):
+        messages: List[MessageSchema]
+        model_config = ConfigDict(model=Thread, include=["id", "title", "messages"])
+
+    with patch.object(logger, "warning") as warning, track_queries() as tracker:
+        ThreadSchema.from_django(Thread.objects.all(), many=True)
+
+    assert tracker.calls == [
+        SchemaQueries(
+            schema="ThreadSchema",
+            rows=3,
+            queries=2,
+            relations={},
+            reads={
+                "id": 3,
+                "title": 3,
+                "messages": 3,
+                "messages__id": 6,
+                "messages__content": 6,
+            },
+        )
+    ]
+    warning.assert_not_called()
+
+    assert _suggest_lookup([(ThreadSchema, "messages")]) == (
+        "prefetch_related",
+        "messages",
+    )
+
+
+@pytest.mark.django_db
+def test_track_queries_suggests_select_related(threads):
+    class MessageSchema(ModelSchema):
+        thread_title: str = Field(alias="thread__title")
+        model_config = ConfigDict(model=Message, include=["id", "thread_title"])
+
+    with patch.object(logger, "warning") as warning, track_queries() as tracker:
+        MessageSchema.from_django(list(Message.objects.all()), many=True)
+
+    assert tracker.calls[0].relations == {"thread__title": 6}
+    assert warning.call_args.kwargs["extra"]["suggestion"] == {
+        "method": "select_related",
+        "lookup": "thread",
+    }
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.events = []
+
+    def observe(self, event, schema, rows, duration, queries):
+        assert duration >= 0
+        self.events.append((event, schema, rows, queries))
+
+
+@pytest.fixture
+def observer():
+    observer = RecordingObserver()
+    add_observer(observer)
+    yield observer
+    remove_observer(observer)
+
+
+@pytest.mark.django_db
+def test_observers(threads, observer):
+    class MessageSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["id", "content"])
+
+    class ThreadSchema(ModelSchema):
+        messages: List[MessageSchema]
+        model_config = ConfigDict(model=Thread, include=["id", "title", "messages"])
+
+    ThreadSchema.from_django(Thread.objects.all(), many=True, optimize=True)
+    assert observer.events == [
+        ("nested", "MessageSchema", 2, 0),
+        ("nested", "MessageSchema", 2, 0),
+        ("nested", "MessageSchema", 2, 0),
+        ("extract", "ThreadSchema", 3, 2),
+        ("validate", "ThreadSchema", 3, 0),
+        ("from_django", "ThreadSchema", 3, 2),
+    ]
+
+    class ThreadTitleSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["title"])
+
+    observer.events.clear()
+    thread = Thread.objects.get(title="First")
+    ThreadTitleSchema(title="Renamed").update(thread, partial=True)
+    assert observer.events == [("update", "ThreadTitleSchema", 1, 1)]
+
+
+@pytest.mark.django_db
+def test_bulk_save_batches_are_observed(observer):
+    class ThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["title"])
+
+    ThreadSchema.bulk_save(
+        [ThreadSchema(title=f"Thread {i}") for i in range(5)], batch_size=2
+    )
+    assert observer.events == [
+        ("bulk_save_batch", "ThreadSchema", 2, 1),
+        ("bulk_save_batch", "ThreadSchema", 2, 1),
+        ("bulk_save_batch", "ThreadSchema", 1, 1),
+        ("bulk_save", "ThreadSchema", 5, 3),
+    ]
+
+
+@pytest.mark.django_db
+def test_histogram_observer(threads):
+    class ThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["id", "title"])
+
+    histogram = HistogramObserver(percentiles=(50, 100))
+    add_observer(histogram)
+    try:
+        for _ in range(4):
+            ThreadSchema.from_django(Thread.objects.all(), many=True)
+    finally:
+        remove_observer(histogram)
+
+    report = histogram.report()
+    assert set(report["ThreadSchema"]) == {"from_django", "extract", "validate"}
+    stats = report["ThreadSchema"]["from_django"]
+    assert (stats["count"], stats["rows"], stats["queries"]) == (4, 12, 4)
+    assert 0 < stats["p50"] <= stats["p100"]
+
+    histogram.reset()
+    assert histogram.report() == {}
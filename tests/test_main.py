@@ -3,6 +3,7 @@ from pydantic import ConfigDict
 from pydantic.errors import PydanticUserError
 
 from djantic import ModelSchema
+from djantic.main import ProxyGetterNestedObj
 from testapp.models import User
 
 
@@ -50,3 +51,18 @@ def test_get_field_names():
         "created_at",
         "updated_at",
     ]
+
+
+@pytest.mark.django_db
+def test_proxy_getter_nested_obj():
+    """
+    Test reading single values from a Django object.
+    """
+    class UserSchema(ModelSchema):
+        model_config = ConfigDict(model=User, include=["id", "first_name", "last_name"])
+
+    user = User.objects.create(first_name="Jordan")
+    proxy = ProxyGetterNestedObj(user, UserSchema)
+    assert proxy.get("first_name") == "Jordan"
+    assert proxy.get("last_name") is None
+    assert proxy.get("last_name", "Eremieff") == "Eremieff"
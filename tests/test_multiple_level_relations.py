@@ -2,7 +2,7 @@ from decimal import Decimal
 from typing import List, Optional
 
 import pytest
-from pydantic import ConfigDict, validator
+from pydantic import ConfigDict, ValidationInfo, field_validator, validator
 from testapp.order import (
     Order,
     OrderItem,
@@ -349,3 +349,122 @@ def test_multiple_level_relations():
         "title": "OrderUserSchema",
         "type": "object",
     }
+
+
+@pytest.mark.django_db
+def test_from_django_passes_context_to_validators():
+    """
+    Test that validators, including the ones of nested schemas, receive the
+    context given to from_django.
+    """
+
+    class OrderItemSchema(ModelSchema):
+        model_config = ConfigDict(model=OrderItem, include=["id", "name"])
+
+        @field_validator("name", check_fields=False)
+        @classmethod
+        def add_prefix(cls, v, info: ValidationInfo):
+            return f"{info.context['prefix']}{v}"
+
+    class OrderSchema(ModelSchema):
+        items: List[OrderItemSchema]
+        model_config = ConfigDict(model=Order, include=["id", "items"])
+
+    OrderUserFactory.create()
+    order = Order.objects.first()
+    names = sorted(item.name for item in order.items.all())
+
+    result = OrderSchema.from_django(order, context={"prefix": "Item: "})
+    assert sorted(item.name for item in result.items) == [
+        f"Item: {name}" for name in names
+    ]
+
+    result = OrderSchema.from_django(
+        Order.objects.all(), many=True, context={"prefix": "Item: "}
+    )
+    assert sorted(item.name for item in result[0].items) == [
+        f"Item: {name}" for name in names
+    ]
+
+
+@pytest.mark.django_db
+def test_optimize_queryset(django_assert_num_queries):
+    class OrderItemDetailSchema(ModelSchema):
+        model_config = ConfigDict(model=OrderItemDetail)
+
+    class OrderItemSchema(ModelSchema):
+        details: List[OrderItemDetailSchema]
+        model_config = ConfigDict(model=OrderItem)
+
+    class OrderSchema(ModelSchema):
+        items: List[OrderItemSchema]
+        model_config = ConfigDict(model=Order)
+
+    class OrderUserProfileSchema(ModelSchema):
+        model_config = ConfigDict(model=OrderUserProfile)
+
+    class OrderUserSchema(ModelSchema):
+        orders: List[OrderSchema]
+        profile: OrderUserProfileSchema
+        model_config = ConfigDict(
+            model=OrderUser, include=("id", "email", "profile", "orders")
+        )
+
+    for i in range(3):
+        OrderUserFactory.create(email=f"user{i}@example.com")
+
+    queryset = OrderUserSchema.optimize_queryset(OrderUser.objects.all())
+    assert queryset.query.select_related == {"profile": {}}
+    assert queryset._prefetch_related_lookups == (
+        "orders",
+        "orders__items",
+        "orders__items__details",
+    )
+
+    expected = OrderUserSchema.from_django(OrderUser.objects.all(), many=True)
+
+    # users joined with their profile, then one query per prefetched level
+    with django_assert_num_queries(4):
+        result = OrderUserSchema.from_django(
+            OrderUser.objects.all(), many=True, optimize=True
+        )
+    assert result == expected
+
+    users = list(OrderUser.objects.all())
+    with django_assert_num_queries(4):
+        result = OrderUserSchema.from_django(users, many=True, optimize=True)
+    assert result == expected
+
+
+@pytest.mark.django_db
+def test_iter_from_django(django_assert_num_queries):
+    class OrderItemDetailSchema(ModelSchema):
+        model_config = ConfigDict(model=OrderItemDetail)
+
+    class OrderItemSchema(ModelSchema):
+        details: List[OrderItemDetailSchema]
+        model_config = ConfigDict(model=OrderItem)
+
+    class OrderSchema(ModelSchema):
+        items: List[OrderItemSchema]
+        model_config = ConfigDict(model=Order)
+
+    for i in range(3):
+        OrderUserFactory.create(email=f"user{i}@example.com")
+
+    expected = OrderSchema.from_django(Order.objects.all(), many=True)
+    assert len(expected) == 6
+
+    result = OrderSchema.iter_from_django(
+        Order.objects.all(), chunk_size=4, optimize=True
+    )
+    assert not isinstance(result, list)
+
+    # orders are fetched once, relations are prefetched for each of the 2 chunks
+    with django_assert_num_queries(5):
+        assert list(result) == expected
+
+    flat = OrderItemDetailSchema.iter_from_django(OrderItemDetail.objects.all())
+    assert list(flat) == OrderItemDetailSchema.from_django(
+        list(OrderItemDetail.objects.all()), many=True
+    )
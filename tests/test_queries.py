@@ -1,9 +1,25 @@
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 import pytest
-from testapp.models import Bookmark, Message, Profile, Tagged, Thread, User
-
-from pydantic import ConfigDict
+from testapp.models import (
+    Article,
+    Bookmark,
+    Label,
+    Message,
+    Note,
+    NullableChar,
+    NullableFK,
+    Profile,
+    Publication,
+    Tagged,
+    Thread,
+    Ticket,
+    User,
+)
+from testapp.order import Order, OrderItem, OrderItemDetail, OrderUserFactory
+
+from pydantic import ConfigDict, Field
 from djantic import ModelSchema
 
 
@@ -36,7 +52,6 @@ def test_get_instance_with_generic_foreign_key():
         model_config = ConfigDict(model=Tagged)
 
     class BookmarkWithTaggedSchema(ModelSchema):
-
         tags: List[TaggedSchema]
         model_config = ConfigDict(model=Bookmark)
 
@@ -239,3 +254,404 @@ def test_get_queryset_with_generic_foreign_key():
         "url": "https://github.com",
         "tags": [{"id": 1}, {"id": 2}],
     }
+
+
+@pytest.mark.django_db
+def test_read_plan_is_compiled_with_the_schema(monkeypatch):
+    """
+    Test that the field getters are built once, when the schema class is created.
+    """
+    from djantic import main
+
+    thread = Thread.objects.create(title="My thread")
+    for content in ("First", "Second"):
+        Message.objects.create(content=content, thread=thread)
+
+    class MessageSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["id", "thread"])
+
+    class ThreadSchema(ModelSchema):
+        messages: List[MessageSchema]
+        model_config = ConfigDict(model=Thread, include=["id", "messages"])
+
+    assert [key for key, _ in ThreadSchema.__read_plan__] == ["messages", "id"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("getters should not be compiled per row")
+
+    monkeypatch.setattr(main, "_compile_value_getter", fail)
+    monkeypatch.setattr(main, "_compile_read_plan", fail)
+
+    assert ThreadSchema.from_django(Thread.objects.all(), many=True) == [
+        {
+            "messages": [{"id": 1, "thread": 1}, {"id": 2, "thread": 1}],
+            "id": 1,
+        }
+    ]
+
+
+@pytest.mark.django_db
+def test_project_queryset(django_assert_num_queries):
+    """
+    Test that only the columns read by the schema are loaded.
+    """
+    thread = Thread.objects.create(title="My thread")
+    Message.objects.create(content="Hello", thread=thread)
+
+    class ThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["title"])
+
+    class MessageSchema(ModelSchema):
+        thread: ThreadSchema
+        model_config = ConfigDict(model=Message, include=["id", "thread"])
+
+    queryset = MessageSchema.project_queryset(Message.objects.select_related("thread"))
+    assert queryset.query.deferred_loading == (
+        {"id", "thread", "thread__title"},
+        False,
+    )
+
+    with django_assert_num_queries(1):
+        assert MessageSchema.from_django(
+            Message.objects.select_related("thread"), many=True
+        ) == [{"id": 1, "thread": {"title": "My thread"}}]
+
+    class ProfileSchema(ModelSchema):
+        first_name: str = Field(alias="user__first_name")
+        model_config = ConfigDict(model=Profile, include=["id", "first_name"])
+
+    queryset = ProfileSchema.project_queryset(Profile.objects.all())
+    assert queryset.query.deferred_loading == ({"id", "user__first_name"}, False)
+
+    # Attributes that are not columns can not be projected
+    class MessageWithExtraSchema(ModelSchema):
+        extra: Optional[str] = None
+        model_config = ConfigDict(model=Message, include=["id", "extra"])
+
+    queryset = Message.objects.all()
+    assert MessageWithExtraSchema.project_queryset(queryset) is queryset
+
+
+@pytest.mark.django_db
+def test_flat_schema_reads_values(monkeypatch, django_assert_num_queries):
+    """
+    Test that flat schemas read querysets without instantiating Django models.
+    """
+    thread = Thread.objects.create(title="My thread")
+    for content in ("First", "Second"):
+        Message.objects.create(content=content, thread=thread)
+
+    class MessageSchema(ModelSchema):
+        title: str = Field(alias="thread__title")
+        model_config = ConfigDict(
+            model=Message, include=["id", "content", "thread", "title"]
+        )
+
+    assert MessageSchema.__values_fields__ == (
+        "id",
+        "content",
+        "thread",
+        "thread__title",
+    )
+    expected = MessageSchema.from_django(list(Message.objects.all()), many=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("model instances should not be created")
+
+    monkeypatch.setattr(Message, "from_db", fail)
+    with django_assert_num_queries(1):
+        result = MessageSchema.from_django(Message.objects.all(), many=True)
+    assert result == expected
+    assert result[0].model_dump(by_alias=True) == {
+        "id": 1,
+        "content": "First",
+        "thread": 1,
+        "thread__title": "My thread",
+    }
+
+    class ThreadSchema(ModelSchema):
+        messages: List[MessageSchema]
+        model_config = ConfigDict(model=Thread, include=["id", "messages"])
+
+    assert ThreadSchema.__values_fields__ is None
+
+
+@pytest.mark.django_db
+def test_distinct_queryset_is_not_read_with_values():
+    for title in ("Same", "Same", "Other"):
+        Thread.objects.create(title=title)
+
+    class ThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["title"])
+
+    queryset = Thread.objects.distinct()
+    assert not ThreadSchema._can_use_values(queryset)
+    assert [
+        thread.title for thread in ThreadSchema.from_django(queryset, many=True)
+    ] == ["Other", "Same", "Same"]
+
+
+@pytest.mark.django_db
+def test_afrom_django():
+    from asgiref.sync import async_to_sync
+
+    thread = Thread.objects.create(title="My thread")
+    for content in ("First", "Second"):
+        Message.objects.create(content=content, thread=thread)
+
+    class MessageSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["id", "content"])
+
+    class ThreadSchema(ModelSchema):
+        messages: List[MessageSchema]
+        model_config = ConfigDict(model=Thread, include=["id", "title", "messages"])
+
+    expected = ThreadSchema.from_django(Thread.objects.all(), many=True)
+    assert (
+        async_to_sync(ThreadSchema.afrom_django)(Thread.objects.all(), many=True)
+        == expected
+    )
+    assert async_to_sync(ThreadSchema.afrom_django)(thread) == expected[0]
+    assert async_to_sync(MessageSchema.afrom_django)(
+        Message.objects.all(), many=True
+    ) == MessageSchema.from_django(Message.objects.all(), many=True)
+
+    class MessageWithThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["id", "thread"])
+
+    assert async_to_sync(MessageWithThreadSchema.afrom_django)(
+        list(Message.objects.all()), many=True
+    ) == [{"id": 1, "thread": 1}, {"id": 2, "thread": 1}]
+
+
+@pytest.mark.django_db
+def test_afrom_django_reads_properties_in_a_thread(monkeypatch):
+    from asgiref.sync import async_to_sync
+
+    thread = Thread.objects.create(title="My thread")
+    Message.objects.create(content="First", thread=thread)
+    monkeypatch.setattr(
+        Thread,
+        "message_count",
+        property(lambda self: self.messages.count()),
+        raising=False,
+    )
+
+    class ThreadSchema(ModelSchema):
+        message_count: int
+        model_config = ConfigDict(model=Thread, include=["id", "message_count"])
+
+    assert async_to_sync(ThreadSchema.afrom_django)(thread) == {
+        "id": 1,
+        "message_count": 1,
+    }
+
+
+@pytest.mark.django_db
+def test_pk_lists_are_prefetched(django_assert_num_queries):
+    publications = [Publication.objects.create(title=f"P{i}") for i in range(3)]
+    for i in range(5):
+        article = Article.objects.create(headline=f"A{i}", pub_date=date(2021, 1, 1))
+        article.publications.set(publications[: i % 3 + 1])
+
+    class ArticleSchema(ModelSchema):
+        model_config = ConfigDict(model=Article, include=["id", "publications"])
+
+    expected = [
+        {
+            "id": article.id,
+            "publications": [{"id": p.id} for p in article.publications.all()],
+        }
+        for article in Article.objects.all()
+    ]
+
+    with django_assert_num_queries(2):
+        assert ArticleSchema.from_django(Article.objects.all(), many=True) == expected
+
+    articles = list(Article.objects.all())
+    with django_assert_num_queries(1):
+        assert ArticleSchema.from_django(articles, many=True) == expected
+
+    # Relations prefetched by the caller are not loaded again
+    queryset = Article.objects.prefetch_related("publications")
+    with django_assert_num_queries(2):
+        assert ArticleSchema.from_django(queryset, many=True) == expected
+
+    with django_assert_num_queries(2):
+        assert list(ArticleSchema.iter_from_django(Article.objects.all())) == expected
+
+    class PublicationSchema(ModelSchema):
+        model_config = ConfigDict(model=Publication, include=["id", "article_set"])
+
+    with django_assert_num_queries(2):
+        publication_schemas = PublicationSchema.from_django(
+            Publication.objects.all(), many=True
+        )
+    assert [len(p.article_set) for p in publication_schemas] == [5, 3, 1]
+
+
+@pytest.mark.django_db
+def test_pk_list_with_custom_primary_key(django_assert_num_queries):
+    labels = [Label.objects.create(code=code) for code in ("bug", "docs")]
+    Note.objects.create(text="First").labels.set(labels)
+    Note.objects.create(text="Second").labels.set(labels[1:])
+
+    class NoteSchema(ModelSchema):
+        model_config = ConfigDict(model=Note, include=["id", "labels"])
+
+    class LabelSchema(ModelSchema):
+        model_config = ConfigDict(model=Label, include=["code", "notes"])
+
+    with django_assert_num_queries(2):
+        assert NoteSchema.from_django(Note.objects.order_by("id"), many=True) == [
+            {"id": 1, "labels": [{"code": "bug"}, {"code": "docs"}]},
+            {"id": 2, "labels": [{"code": "docs"}]},
+        ]
+    assert NoteSchema.from_django(Note.objects.get(id=2)) == {
+        "id": 2,
+        "labels": [{"code": "docs"}],
+    }
+
+    with django_assert_num_queries(2):
+        assert LabelSchema.from_django(Label.objects.order_by("code"), many=True) == [
+            {"code": "bug", "notes": [{"id": 1}]},
+            {"code": "docs", "notes": [{"id": 1}, {"id": 2}]},
+        ]
+
+
+@pytest.mark.django_db
+def test_foreign_key_is_read_from_its_column(django_assert_num_queries):
+    thread = Thread.objects.create(title="My thread")
+    for content in ("First", "Second"):
+        Message.objects.create(content=content, thread=thread)
+    NullableFK.objects.create(nullable_char=NullableChar.objects.create(value="a"))
+    NullableFK.objects.create(nullable_char=None)
+
+    class MessageSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["id", "thread"])
+
+    class NullableFKSchema(ModelSchema):
+        model_config = ConfigDict(model=NullableFK, include=["id", "nullable_char"])
+
+    messages = list(Message.objects.all())
+    nullable_fks = list(NullableFK.objects.order_by("id"))
+    with django_assert_num_queries(0):
+        assert MessageSchema.from_django(messages, many=True) == [
+            {"id": 1, "thread": 1},
+            {"id": 2, "thread": 1},
+        ]
+        assert NullableFKSchema.from_django(nullable_fks, many=True) == [
+            {"id": 1, "nullable_char": 1},
+            {"id": 2, "nullable_char": None},
+        ]
+
+    # Foreign keys to another field than the primary key read the related object
+    user = User.objects.create(first_name="Jordan", email="jordan@eremieff.com")
+    Ticket.objects.create(title="My ticket", user=user)
+
+    class TicketSchema(ModelSchema):
+        model_config = ConfigDict(model=Ticket, include=["id", "user"])
+
+    assert TicketSchema.from_django(Ticket.objects.get()) == {"id": 1, "user": 1}
+
+    # Other objects expose the related object or its primary key
+    from types import SimpleNamespace
+
+    assert MessageSchema.from_django(SimpleNamespace(id=3, thread=thread)) == {
+        "id": 3,
+        "thread": 1,
+    }
+    assert MessageSchema.from_django(SimpleNamespace(id=4, thread=1)) == {
+        "id": 4,
+        "thread": 1,
+    }
+
+
+@pytest.mark.django_db
+def test_nested_relations_are_batched(django_assert_num_queries):
+    for i in range(2):
+        OrderUserFactory.create(email=f"user{i}@example.com")
+
+    class OrderItemDetailSchema(ModelSchema):
+        model_config = ConfigDict(model=OrderItemDetail, include=["id", "name"])
+
+    class OrderItemSchema(ModelSchema):
+        details: List[OrderItemDetailSchema]
+        model_config = ConfigDict(model=OrderItem, include=["id", "details"])
+
+    class OrderSchema(ModelSchema):
+        items: List[OrderItemSchema]
+        model_config = ConfigDict(model=Order, include=["id", "items"])
+
+    expected = [
+        {
+            "id": order.id,
+            "items": [
+                {
+                    "id": item.id,
+                    "details": [
+                        {"id": detail.id, "name": detail.name}
+                        for detail in item.details.all()
+                    ],
+                }
+                for item in order.items.all()
+            ],
+        }
+        for order in Order.objects.all()
+    ]
+
+    # One query per relation and level, whatever the number of orders
+    with django_assert_num_queries(3):
+        assert OrderSchema.from_django(Order.objects.all(), many=True) == expected
+
+    orders = list(Order.objects.all())
+    with django_assert_num_queries(2):
+        assert OrderSchema.from_django(orders, many=True) == expected
+
+
+@pytest.mark.django_db
+def test_plain_objects_are_not_prefetched():
+    from types import SimpleNamespace
+
+    from asgiref.sync import async_to_sync
+
+    class MessageSchema(ModelSchema):
+        model_config = ConfigDict(model=Message, include=["id", "content"])
+
+    class ThreadSchema(ModelSchema):
+        messages: List[MessageSchema]
+        model_config = ConfigDict(model=Thread, include=["id", "title", "messages"])
+
+    threads = [
+        SimpleNamespace(
+            id=1,
+            title="My thread",
+            messages=[SimpleNamespace(id=1, content="First")],
+        )
+    ]
+    expected = [
+        {"id": 1, "title": "My thread", "messages": [{"id": 1, "content": "First"}]}
+    ]
+    assert ThreadSchema.from_django(threads, many=True) == expected
+    assert ThreadSchema.from_django(threads[0], optimize=True) == expected[0]
+    assert async_to_sync(ThreadSchema.afrom_django)(threads, many=True) == expected
+
+
+@pytest.mark.django_db
+def test_read_plan_is_compiled_after_model_rebuild():
+    thread = Thread.objects.create(title="My thread")
+    Message.objects.create(content="First", thread=thread)
+
+    class MessageSchema(ModelSchema):
+        thread: "ThreadSchema"
+        model_config = ConfigDict(model=Message, include=["id", "content", "thread"])
+
+    class ThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["id", "title"])
+
+    MessageSchema.model_rebuild()
+
+    expected = {"id": 1, "content": "First", "thread": {"id": 1, "title": "My thread"}}
+    assert MessageSchema.__values_fields__ is None
+    assert MessageSchema.from_django(Message.objects.get()) == expected
+    assert MessageSchema.from_django(Message.objects.all(), many=True) == [expected]
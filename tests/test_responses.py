@@ -0,0 +1,37 @@
+import json
+
+import pytest
+from pydantic import ConfigDict
+from testapp.models import Thread
+
+from djantic import ModelSchema
+from djantic.responses import stream_from_django
+
+
+@pytest.mark.django_db
+def test_stream_from_django():
+    for title in ("First", "Second", "Third"):
+        Thread.objects.create(title=title)
+
+    class ThreadSchema(ModelSchema):
+        model_config = ConfigDict(model=Thread, include=["id", "title"])
+
+    expected = [
+        {"id": 1, "title": "First"},
+        {"id": 2, "title": "Second"},
+        {"id": 3, "title": "Third"},
+    ]
+
+    response = stream_from_django(ThreadSchema, Thread.objects.all(), chunk_size=2)
+    assert response["Content-Type"] == "application/json"
+    assert json.loads(b"".join(response.streaming_content)) == expected
+
+    response = stream_from_django(
+        ThreadSchema, Thread.objects.all(), ndjson=True, chunk_size=2
+    )
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert [json.loads(line) for line in lines] == expected
+
+    response = stream_from_django(ThreadSchema, Thread.objects.none())
+    assert json.loads(b"".join(response.streaming_content)) == []
@@ -1,10 +1,14 @@
 from typing import Optional, TypeVar
+from unittest.mock import patch
 
+import django
 import pytest
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 from pydantic import Field
 
 from djantic import ModelSchema
+from djantic.mixin import logger
 from testapp.models import Profile, User
 
 
@@ -133,3 +137,121 @@ def test_generic_type_inference_no_model_param():
 
     # Verify the model was correctly inferred from the generic type
     assert user_schema.model_config["model"] == User
+
+
+@pytest.mark.django_db
+def test_bulk_save(django_assert_num_queries):
+    class UserSchema(ModelSchema[User]):
+        class Config:
+            include = ("first_name", "last_name", "email")
+
+    users = [
+        UserSchema(first_name=f"User {i}", email=f"user{i}@example.com")
+        for i in range(5)
+    ]
+
+    with django_assert_num_queries(3), patch.object(logger, "debug") as debug:
+        records = UserSchema.bulk_save(users, batch_size=2)
+
+    assert [record.email for record in records] == [user.email for user in users]
+    assert User.objects.count() == 5
+    assert debug.call_count == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(django.VERSION < (4, 1), reason="Requires Django 4.1")
+def test_bulk_save_update_conflicts():
+    class UserSchema(ModelSchema[User]):
+        class Config:
+            include = ("id", "first_name", "last_name", "email")
+
+    User.objects.create(first_name="User", email="user@example.com")
+    users = [
+        UserSchema(first_name="Updated", email="user@example.com"),
+        UserSchema(first_name="New", email="new@example.com"),
+    ]
+    UserSchema.bulk_save(users, update_conflicts=True, unique_fields=["email"])
+    assert User.objects.count() == 2
+    assert User.objects.get(email="user@example.com").first_name == "Updated"
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(django.VERSION >= (4, 1), reason="Requires Django < 4.1")
+def test_bulk_save_update_conflicts_unsupported():
+    class UserSchema(ModelSchema[User]):
+        class Config:
+            include = ("first_name", "last_name", "email")
+
+    users = [UserSchema(first_name="User", email="user@example.com")]
+    with pytest.raises(ValueError, match="requires Django 4.1"):
+        UserSchema.bulk_save(users, update_conflicts=True, unique_fields=["email"])
+
+
+@pytest.mark.django_db
+def test_partial_update_saves_changed_fields():
+    class UserPartialSchema(ModelSchema[User]):
+        first_name: Optional[str]
+        last_name: Optional[str]
+        email: Optional[str]
+
+        class Config:
+            exclude = ("created_at", "updated_at")
+
+    user = User.objects.create(
+        first_name="John", last_name="Doe", email="john.doe@example.com"
+    )
+    updated_at = user.updated_at
+
+    user_schema = UserPartialSchema(email="email@email.com", first_name="John")
+    with CaptureQueriesContext(connection) as queries:
+        user_schema.save(instance=user, partial=True)
+
+    assert len(queries) == 1
+    sql = queries[0]["sql"]
+    assert '"email"' in sql and '"updated_at"' in sql
+    assert '"first_name"' not in sql and '"last_name"' not in sql
+
+    user.refresh_from_db()
+    assert user.email == "email@email.com"
+    assert user.last_name == "Doe"
+    assert user.updated_at > updated_at
+
+    # Nothing changed, so nothing is written
+    with CaptureQueriesContext(connection) as queries:
+        user_schema.save(instance=user, partial=True)
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_bulk_update():
+    class UserPartialSchema(ModelSchema[User]):
+        first_name: Optional[str]
+        last_name: Optional[str]
+        email: Optional[str]
+
+        class Config:
+            exclude = ("created_at", "updated_at")
+
+    users = [
+        User.objects.create(first_name=f"User {i}", email=f"user{i}@example.com")
+        for i in range(4)
+    ]
+    pairs = [
+        (users[0], UserPartialSchema(first_name="Jane")),
+        (users[1], UserPartialSchema(first_name="John")),
+        (users[2], UserPartialSchema(last_name="Doe", email="doe@example.com")),
+        (users[3], UserPartialSchema(first_name="User 3")),
+    ]
+
+    with CaptureQueriesContext(connection) as queries:
+        updated = UserPartialSchema.bulk_update(pairs)
+
+    # One UPDATE per group of changed fields, the unchanged user is skipped
+    assert len([q for q in queries if q["sql"].startswith("UPDATE")]) == 2
+    assert updated == users[:3]
+    assert list(User.objects.values_list("first_name", "last_name", "email")) == [
+        ("Jane", None, "user0@example.com"),
+        ("John", None, "user1@example.com"),
+        ("User 2", "Doe", "doe@example.com"),
+        ("User 3", None, "user3@example.com"),
+    ]
@@ -1,13 +1,15 @@
 import datetime
 from typing import Optional
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel, Field
+from pydantic.json_schema import GenerateJsonSchema
 
 from testapp.models import User, Profile, Configuration
 
 from pydantic import ConfigDict, AliasGenerator
-from djantic import ModelSchema
+from djantic import ModelSchema, generate_json_schemas
 
 
 @pytest.mark.django_db
@@ -289,3 +291,89 @@ def test_include_from_annotations():
         "properties": {"website": {"title": "Website", "type": "string"}},
         "required": ["website"],
     }
+
+
+@pytest.mark.django_db
+def test_defer_build(settings):
+    """
+    Test schemas that are only built on first use.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    user = User.objects.create(first_name="Jordan", email="jordan@eremieff.com")
+
+    settings.DJANTIC_DEFER_BUILD = True
+
+    class UserSchema(ModelSchema):
+        model_config = ConfigDict(model=User, include=["id", "first_name"])
+
+    class EagerUserSchema(ModelSchema):
+        model_config = ConfigDict(
+            model=User, include=["id", "first_name"], defer_build=False
+        )
+
+    assert not UserSchema.__pydantic_complete__
+    assert EagerUserSchema.__pydantic_complete__
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(UserSchema.model_validate, [{"id": 1, "first_name": "A"}] * 8)
+        )
+    assert UserSchema.__pydantic_complete__
+    assert all(result.first_name == "A" for result in results)
+
+    assert UserSchema.from_django(user).model_dump() == {
+        "id": 1,
+        "first_name": "Jordan",
+    }
+
+
+@pytest.mark.django_db
+def test_json_schema_is_cached():
+    class UserSchema(ModelSchema):
+        model_config = ConfigDict(model=User, include=["id", "first_name"])
+
+    with patch.object(
+        GenerateJsonSchema,
+        "generate",
+        autospec=True,
+        side_effect=GenerateJsonSchema.generate,
+    ) as generate:
+        schema = UserSchema.model_json_schema()
+        schema["properties"].clear()
+        properties = UserSchema.model_json_schema()["properties"]
+        assert set(properties) == {"id", "first_name"}
+        assert generate.call_count == 1
+
+        UserSchema.model_json_schema(mode="serialization")
+        assert generate.call_count == 2
+
+
+@pytest.mark.django_db
+def test_generate_json_schemas():
+    class ProfileSchema(ModelSchema):
+        model_config = ConfigDict(model=Profile, include=["id", "website"])
+
+    class UserSchema(ModelSchema):
+        profile: ProfileSchema
+        model_config = ConfigDict(model=User, include=["id", "profile"])
+
+    class UserListSchema(ModelSchema):
+        model_config = ConfigDict(model=User, exclude=["profile"])
+
+    refs, definitions = generate_json_schemas(
+        [UserSchema, ProfileSchema, UserListSchema],
+        ref_template="#/components/schemas/{model}",
+    )
+    assert refs == {
+        UserSchema: {"$ref": "#/components/schemas/UserSchema"},
+        ProfileSchema: {"$ref": "#/components/schemas/ProfileSchema"},
+        UserListSchema: {"$ref": "#/components/schemas/UserListSchema"},
+    }
+    defs = definitions["$defs"]
+    assert set(defs) == {"UserSchema", "ProfileSchema", "UserListSchema"}
+    assert defs["UserSchema"]["properties"]["profile"] == {
+        "$ref": "#/components/schemas/ProfileSchema"
+    }
+    assert set(defs["ProfileSchema"]["properties"]) == {"id", "website"}
+    assert "profile" not in defs["UserListSchema"]["properties"]
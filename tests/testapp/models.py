@@ -290,3 +290,31 @@ class NullableChar(models.Model):
 
 class NullableFK(models.Model):
     nullable_char = models.ForeignKey(NullableChar, null=True, blank=True, on_delete=models.CASCADE)
+
+
+class Ticket(models.Model):
+    """
+    A ticket filed by a user, referenced by their email.
+    """
+
+    title = models.CharField(max_length=100)
+    user = models.ForeignKey(
+        User, to_field="email", related_name="+", on_delete=models.CASCADE
+    )
+
+
+class Label(models.Model):
+    """
+    A label identified by its code.
+    """
+
+    code = models.SlugField(max_length=30, primary_key=True)
+
+
+class Note(models.Model):
+    """
+    A note with labels.
+    """
+
+    text = models.TextField()
+    labels = models.ManyToManyField(Label, related_name="notes")